@@ -1,13 +1,9 @@
 from __future__ import annotations
 
-import inspect
-from abc import ABC, abstractmethod
-from contextlib import asynccontextmanager
-from types import AsyncGeneratorType
-from typing import TYPE_CHECKING, Any, Self, TypeVar
+from typing import TYPE_CHECKING, Any, ClassVar, Self, TypeVar
 
 from .datastructures import Method, State
-from .middleware import Middleware, MiddlewareBase, ServerErrorMiddleware
+from .middleware import Middleware, ServerErrorMiddleware
 from .routing import BaseRoute, Route, Router
 
 if TYPE_CHECKING:
@@ -35,25 +31,97 @@ class LifespanYieldedMultipleTimesError(KoldAPIBaseError):
     """Lifespan Yielded Multiple Times Error."""
 
 
-class KoldAPI(ABC):
+class _LifespanManager:
+    """
+    Drive the application's ``lifespan`` generator as an async context manager.
+
+    Hand-rolled instead of ``asynccontextmanager``: the generator is advanced
+    with exactly two ``__anext__`` calls, so each failure mode maps straight
+    onto its dedicated error without the contextlib generator-protocol frames
+    in between.
+
+    Raises:
+        LifespanIsNotAsyncGeneratorError: If ``lifespan`` is not an async generator.
+        LifespanYieldMissingError: If the ``lifespan`` generator does not yield.
+        LifespanYieldedMultipleTimesError: If ``lifespan`` yields more than once.
+    """
+
+    __slots__ = ("_app", "_generator")
+
+    def __init__(self, app: KoldAPI, /) -> None:
+        self._app: KoldAPI = app
+        self._generator: AsyncGenerator[Any, None] | None = None
+
+    async def __aenter__(self) -> None:
+        # Typed Any: the duck-typed checks below accept plain coroutines as
+        # well as the async generator the signature declares.
+        lifespan_generator: Any = self._app.lifespan(self._app)
+
+        # Duck-typed checks: async generators expose __anext__, plain
+        # coroutines expose __await__ but not __anext__.
+        if not hasattr(lifespan_generator, "__anext__"):
+            if hasattr(lifespan_generator, "__await__"):
+                await lifespan_generator
+            else:
+                raise LifespanIsNotAsyncGeneratorError()
+
+            raise LifespanYieldMissingError()
+
+        self._generator = lifespan_generator
+        try:
+            resources: Any = await lifespan_generator.__anext__()
+        except StopAsyncIteration:
+            raise LifespanYieldMissingError() from None
+
+        if resources is not None:
+            for key, value in resources.items():
+                setattr(self._app.state, key, value)
+
+    async def __aexit__(self, exc_type: object, exc: object, traceback: object) -> None:
+        generator: AsyncGenerator[Any, None] | None = self._generator
+        if generator is None:
+            return
+
+        try:
+            await generator.__anext__()
+        except StopAsyncIteration:
+            return
+
+        raise LifespanYieldedMultipleTimesError()
+
+
+class KoldAPI:
+    _GET_METHODS: ClassVar[tuple[Method, ...]] = (Method.GET,)
+    _POST_METHODS: ClassVar[tuple[Method, ...]] = (Method.POST,)
+    _PUT_METHODS: ClassVar[tuple[Method, ...]] = (Method.PUT,)
+    _DELETE_METHODS: ClassVar[tuple[Method, ...]] = (Method.DELETE,)
+    _HEAD_METHODS: ClassVar[tuple[Method, ...]] = (Method.HEAD,)
+    _OPTIONS_METHODS: ClassVar[tuple[Method, ...]] = (Method.OPTIONS,)
+    _TRACE_METHODS: ClassVar[tuple[Method, ...]] = (Method.TRACE,)
+
     def __init__(self: AppType):
         self.config: Config = self.setup()
         self.state: State = State()
         self.router: Router = Router(self.config, self._lifespan_context())
 
-        self._middleware_stack: ASGIApp = self._build_middleware_stack()
+        # Built lazily on first call: routes and middleware registered after
+        # construction (decorators run at import time) are folded in exactly
+        # once, and steady-state requests skip the assembly entirely.
+        self._middleware_stack: ASGIApp | None = None
 
     @property
     def routes(self) -> list[BaseRoute]:
         return self.router.routes
 
-    @abstractmethod
     def setup(self) -> Config:
         """Initiate the application with the provided configuration.
 
+        Subclasses must override this; the base implementation raises.
+
         Returns:
             ``koldapi.Config`` - application configuration.
         """
+        raise NotImplementedError()
 
     async def lifespan(self, app: Self, /) -> AsyncGenerator[Any, None]:
         """
@@ -139,57 +207,55 @@ class KoldAPI(ABC):
         path: str,
         /,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
-        return self._add_route(path, [Method.GET])
+        return self._add_route(path, self._GET_METHODS)
 
     def post(
         self,
         path: str,
         /,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
-        return self._add_route(path, [Method.POST])
+        return self._add_route(path, self._POST_METHODS)
 
     def put(
         self,
         path: str,
         /,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
-        return self._add_route(path, [Method.PUT])
+        return self._add_route(path, self._PUT_METHODS)
 
     def delete(
         self,
         path: str,
         /,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
-        return self._add_route(path, [Method.DELETE])
+        return self._add_route(path, self._DELETE_METHODS)
 
     def head(
         self,
         path: str,
         /,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
-        return self._add_route(path, [Method.HEAD])
+        return self._add_route(path, self._HEAD_METHODS)
 
     def options(
         self,
         path: str,
         /,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
-        return self._add_route(path, [Method.OPTIONS])
+        return self._add_route(path, self._OPTIONS_METHODS)
 
     def trace(
         self,
         path: str,
         /,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
-        return self._add_route(path, [Method.TRACE])
+        return self._add_route(path, self._TRACE_METHODS)
 
     def _lifespan_context(self) -> Lifespan[Self]:
         """
-        Wrap the user-defined ``lifespan`` coroutine into an async context manager.
+        Return the async context manager driving the user-defined ``lifespan``.
 
-        This method converts the ``lifespan`` async generator defined by the user
-        into a standard `asynccontextmanager` that can be used by the router or
-        ASGI server. It handles:
+        The shared ``_LifespanManager`` handles:
 
         - Applying returned resources to the application's state.
         - Ensuring that ``lifespan`` yields exactly once.
@@ -203,35 +269,12 @@ class KoldAPI(ABC):
             LifespanYieldMissingError: If the user's ``lifespan`` generator does not yield.
             LifespanYieldedMultipleTimesError: If the user's ``lifespan`` yields more than once.
         """
-
-        @asynccontextmanager
-        async def manager(app: Self, /) -> AsyncGenerator[None, None]:
-            lifespan_generator: AsyncGenerator[Any, None] = self.lifespan(app)
-
-            if not isinstance(lifespan_generator, AsyncGeneratorType):
-                if inspect.iscoroutine(lifespan_generator):
-                    await lifespan_generator
-                else:
-                    raise LifespanIsNotAsyncGeneratorError()
-
-                raise LifespanYieldMissingError()
-
-            yielded: bool = False
-            async for resources in lifespan_generator:
-                if yielded:
-                    raise LifespanYieldedMultipleTimesError()
-                yielded = True
-                if resources is not None:
-                    for key, value in resources.items():
-                        setattr(app.state, key, value)
-                yield
-
-        return manager
+        return _LifespanManager
 
     def _add_route(
         self,
         path: str,
-        methods: list[Method],
+        methods: tuple[Method, ...],
         /,
     ) -> Callable[[DecoratedCallable], DecoratedCallable]:
         """
@@ -239,7 +282,7 @@ class KoldAPI(ABC):
 
         Args:
             path: The URL path for the route (e.g., "/users").
-            methods: HTTP method list.
+            methods: HTTP methods the route serves.
 
         Returns:
             Callable[[DecoratedCallable], DecoratedCallable]: A decorator that,
@@ -266,28 +309,18 @@ class KoldAPI(ABC):
         Returns:
             ASGIApp: The final ASGI application with all middleware applied.
         """
-        app: ASGIApp = self.router
-
-        middleware_list: list[Middleware[MiddlewareBase | Any]] = [
-            Middleware(ServerErrorMiddleware, self.config),
-            *self.middleware_stack(),
-        ]
+        app: ASGIApp = Middleware.build_chain(self.middleware_stack(), self.router)
 
-        middleware: Middleware[MiddlewareBase | Any]
-        for middleware in reversed(middleware_list):
-            app = middleware(app)
+        if self.config.debug:
+            # Instantiated directly: the Middleware factory indirection buys
+            # nothing for a system layer with known arguments. Outside debug
+            # mode ServerErrorMiddleware only re-raises, so the layer is
+            # skipped and the ASGI server's default 500 handling is relied
+            # on, as its docstring already documents.
+            app = ServerErrorMiddleware(app, self.config)
 
         return app
 
-    def _populate_scope(self, scope: Scope, /) -> None:
-        """
-        Populate the scope with extra values.
-
-        Args:
-            scope: Static request information, such as request type (http, websocket), headers, etc.
-        """
-        scope["app"] = self
-
     async def __call__(self, scope: Scope, receive: Receive, send: Send, /) -> None:
         """
         Get the request and process it through middleware stack.
@@ -297,5 +330,10 @@ class KoldAPI(ABC):
             receive: An awaitable callable that yields incoming events/messages from the client or server.
             send: An awaitable callable used to send events/messages back to the client or server.
         """
-        self._populate_scope(scope)
-        await self._middleware_stack(scope, receive, send)
+        middleware_stack: ASGIApp | None = self._middleware_stack
+        if middleware_stack is None:
+            middleware_stack = self._build_middleware_stack()
+            self._middleware_stack = middleware_stack
+
+        scope["app"] = self
+        await middleware_stack(scope, receive, send)
@@ -1,14 +1,45 @@
-from dataclasses import dataclass
+from dataclasses import FrozenInstanceError
+from typing import Any
 
 
-@dataclass(frozen=True)
 class Config:
     """
     Configuration settings for the application.
 
+    A hand-rolled frozen slots class: frozen dataclasses route every write
+    through an overridden ``__setattr__`` and pay descriptor overhead on
+    reads, while plain slots make ``config.debug`` a C-level slot load on
+    the request hot path.
+
     Attributes:
         debug: Indicates whether the application is running in a debug mode.
             Defaults to False.
     """
 
-    debug: bool = False
+    __slots__ = ("debug",)
+
+    # Annotation only (no value), so it declares the slot to the type
+    # checker without shadowing the slot descriptor.
+    debug: bool
+
+    def __init__(self, debug: bool = False) -> None:
+        object.__setattr__(self, "debug", debug)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Same exception type a frozen dataclass raises, so callers (and
+        # tests) relying on FrozenInstanceError keep working.
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(debug={self.debug!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Config):
+            return NotImplemented
+        return self.debug == other.debug
+
+    def __hash__(self) -> int:
+        return hash((type(self), self.debug))
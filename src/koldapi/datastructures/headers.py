@@ -1,26 +1,50 @@
 from __future__ import annotations
 
-from collections.abc import Iterator, MutableMapping
+from collections.abc import ItemsView, Iterator, KeysView, MutableMapping, ValuesView
 from typing import TYPE_CHECKING, Any, ClassVar
 
 if TYPE_CHECKING:
     from koldapi._types import Scope
 
 
+def _encode_header(value: str, /) -> bytes:
+    """
+    Encode a header string for the wire.
+
+    Header names and almost all values are plain ASCII; ``str.isascii`` is
+    O(1) on compact strings, so probe it first and take CPython's dedicated
+    ASCII codec fast path, falling back to latin-1 otherwise.
+    """
+    if value.isascii():
+        return value.encode("ascii")
+    return value.encode(Headers._encoding)
+
+
 class Headers(MutableMapping[str, str]):
     """
     A case-insensitive HTTP headers container.
     """
 
+    __slots__ = ("_raw", "_raw_store", "_released", "_store")
+
     # According to the ISO-8859-1 standard headers shall be in latin-1 encoding.
     # However, ASGI servers can accept and handle other encoding such as UTF-8.
     _encoding: ClassVar[str] = "latin-1"
 
+    # Free list of released instances, recycled by from_scope to avoid a
+    # fresh allocation per request. Filling it is opt-in via release().
+    _pool: ClassVar[list[Headers]] = []
+    _pool_size: ClassVar[int] = 128
+
     def __init__(self, headers: dict[str, str] | None = None) -> None:
         self._store: dict[str, str] = {}
-        self._set_headers(headers)
-
+        # Pre-encoded (key, value) pairs, kept in sync with the store on every
+        # mutation so building ``raw`` never has to re-encode existing headers.
+        self._raw_store: dict[str, tuple[bytes, bytes]] = {}
         self._raw: list[tuple[bytes, bytes]] | None = None
+        self._released: bool = False
+
+        self._set_headers(headers)
 
     @classmethod
     def from_scope(cls, scope: Scope, /) -> Headers:
@@ -33,9 +57,52 @@ class Headers(MutableMapping[str, str]):
         Returns:
             Headers: A new Headers instance populated with headers from the scope.
         """
-        raw_headers = scope.get("headers", [])
-        decoded_headers = {k.decode(cls._encoding): v.decode(cls._encoding) for k, v in raw_headers}
-        return cls(decoded_headers)
+        headers: Headers = cls._acquire()
+
+        encoding: str = cls._encoding
+        store: dict[str, str] = headers._store
+        raw_store: dict[str, tuple[bytes, bytes]] = headers._raw_store
+
+        key_bytes: bytes
+        value_bytes: bytes
+        for key_bytes, value_bytes in scope.get("headers", []):
+            key: str = key_bytes.decode(encoding)
+            lower_key: str = key.lower()
+            store[lower_key] = value_bytes.decode(encoding)
+            # ASGI servers deliver header names lowercased already, so the raw
+            # bytes can usually be kept as-is without a round-trip re-encode.
+            raw_store[lower_key] = (key_bytes if key == lower_key else lower_key.encode(encoding), value_bytes)
+
+        return headers
+
+    @classmethod
+    def _acquire(cls) -> Headers:
+        """
+        Pop a recycled instance from the free list, or allocate a new one.
+        """
+        if cls._pool:
+            headers: Headers = cls._pool.pop()
+            headers._released = False
+            return headers
+        return cls()
+
+    def release(self) -> None:
+        """
+        Reset the container and return it to the free list.
+
+        Opt-in: callers that own the full request lifecycle can recycle
+        per-request containers instead of discarding them. The instance
+        must not be touched after it has been released; duplicate releases
+        are dropped so one instance can never enter the pool twice.
+        """
+        if self._released:
+            return
+        self._released = True
+        if len(self._pool) < self._pool_size:
+            self._store.clear()
+            self._raw_store.clear()
+            self._raw = None
+            self._pool.append(self)
 
     def _set_headers(self, headers: dict[str, str] | None) -> None:
         """
@@ -55,19 +122,38 @@ class Headers(MutableMapping[str, str]):
         Return headers in ASGI raw format.
         """
         if self._raw is None:
-            self._raw = [(k.encode(self._encoding), v.encode(self._encoding)) for k, v in self._store.items()]
+            self._raw = list(self._raw_store.values())
 
         return self._raw
 
+    # Override the MutableMapping mixins on the read path: the mixins go
+    # through Python-level __iter__/__getitem__ calls, while delegating to the
+    # backing dict keeps lookups and views at C level.
+    def get(self, key: str, default: Any = None, /) -> Any:
+        return self._store.get(key.lower(), default)
+
+    def keys(self) -> KeysView[str]:
+        return self._store.keys()
+
+    def values(self) -> ValuesView[str]:
+        return self._store.values()
+
+    def items(self) -> ItemsView[str, str]:
+        return self._store.items()
+
     def __getitem__(self, key: str, /) -> str:
         return self._store[key.lower()]
 
     def __setitem__(self, key: str, value: str, /) -> None:
-        self._store[key.lower()] = value
+        lower_key: str = key.lower()
+        self._store[lower_key] = value
+        self._raw_store[lower_key] = (_encode_header(lower_key), _encode_header(value))
         self._raw = None
 
     def __delitem__(self, key: str, /) -> None:
-        del self._store[key.lower()]
+        lower_key: str = key.lower()
+        del self._store[lower_key]
+        del self._raw_store[lower_key]
         self._raw = None
 
     def __iter__(self) -> Iterator[str]:
@@ -77,6 +163,10 @@ class Headers(MutableMapping[str, str]):
         return len(self._store)
 
     def __contains__(self, key: Any, /) -> bool:
-        if not isinstance(key, str):
+        # Keys are virtually always strings; optimistically lowercase and let
+        # the rare non-string probe pay for the exception instead of every
+        # call paying for an isinstance check.
+        try:
+            return key.lower() in self._store
+        except AttributeError:
             return False
-        return key.lower() in self._store
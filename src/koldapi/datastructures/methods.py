@@ -1,3 +1,4 @@
+import sys
 from enum import StrEnum
 
 
@@ -24,3 +25,15 @@ class Method(StrEnum):
     MOVE = "MOVE"
     LOCK = "LOCK"
     UNLOCK = "UNLOCK"
+
+
+# Interning the method values lets dict probes and equality checks against
+# scope["method"] take CPython's pointer-comparison fast path whenever the
+# server side hands over interned strings as well.
+for _method in Method:
+    sys.intern(str(_method))
+
+# One bit per method, so a set of allowed methods collapses into an int and
+# membership tests into a single AND. Unknown methods map to 0 via
+# METHOD_BITS.get and therefore never match any mask.
+METHOD_BITS: dict[str, int] = {str(method): 1 << index for index, method in enumerate(Method)}
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Iterator, Mapping
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 from urllib.parse import parse_qs
 
 if TYPE_CHECKING:
@@ -9,24 +9,70 @@ if TYPE_CHECKING:
 
 
 class QueryParams(Mapping[str, list[str]]):
+    __slots__ = ("_dict", "_raw", "_released")
+
     _encoding: str = "latin-1"
 
+    # Free list of released instances, recycled by from_scope to avoid a
+    # fresh allocation per request. Filling it is opt-in via release().
+    _pool: ClassVar[list[QueryParams]] = []
+    _pool_size: ClassVar[int] = 128
+
+    def __init__(self, params: dict[str, list[str]] | None = None) -> None:
+        self._raw: bytes = b""
+        self._released: bool = False
+        # None marks "not parsed yet"; parse_qs only runs if the handler
+        # actually touches the query params.
+        self._dict: dict[str, list[str]] | None = params
+
     @classmethod
     def from_scope(cls, scope: Scope, /) -> QueryParams:
-        query_string: str = scope["query_string"].decode(cls._encoding)
-        return cls(parse_qs(query_string, keep_blank_values=True))
+        raw_query_string: bytes = scope["query_string"]
+        if cls._pool:
+            query_params: QueryParams = cls._pool.pop()
+            query_params._raw = raw_query_string
+            query_params._dict = {} if not raw_query_string else None
+            query_params._released = False
+            return query_params
+
+        query_params = cls()
+        query_params._raw = raw_query_string
+        if not raw_query_string:
+            query_params._dict = {}
+        return query_params
+
+    def release(self) -> None:
+        """
+        Reset the container and return it to the free list.
+
+        Opt-in: callers that own the full request lifecycle can recycle
+        per-request containers instead of discarding them. The instance
+        must not be touched after it has been released; duplicate releases
+        are dropped so one instance can never enter the pool twice.
+        """
+        if self._released:
+            return
+        self._released = True
+        if len(self._pool) < self._pool_size:
+            self._raw = b""
+            self._dict = {}
+            self._pool.append(self)
 
-    def __init__(self, params: dict[str, list[str]]) -> None:
-        self._dict: dict[str, list[str]] = params
+    def _parse(self) -> dict[str, list[str]]:
+        params: dict[str, list[str]] | None = self._dict
+        if params is None:
+            params = parse_qs(self._raw.decode(self._encoding), keep_blank_values=True)
+            self._dict = params
+        return params
 
     def __getitem__(self, key: str) -> list[str]:
-        return self._dict[key]
+        return self._parse()[key]
 
     def __iter__(self) -> Iterator[str]:
-        return iter(self._dict)
+        return iter(self._parse())
 
     def __len__(self) -> int:
-        return len(self._dict)
+        return len(self._parse())
 
     def __contains__(self, key: Any) -> bool:
-        return key in self._dict
+        return key in self._parse()
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 
 class State(dict[str, Any]):
@@ -9,14 +9,24 @@ class State(dict[str, Any]):
     connections, configuration, or external service clients.
     """
 
+    __slots__ = ()
+
+    if TYPE_CHECKING:
+        # Typed signatures for the checker; the C-level bindings below
+        # replace the method objects mypy would otherwise reason about.
+        def __setattr__(self, key: str, value: Any) -> None: ...
+
+        def __delattr__(self, key: str) -> None: ...
+
+    else:
+        # Binding the mutating attribute hooks straight to the dict slots
+        # keeps state writes and deletes at C level, with no Python frame
+        # per access.
+        __setattr__ = dict.__setitem__
+        __delattr__ = dict.__delitem__
+
     def __getattr__(self, key: str) -> Any:
         try:
             return self[key]
         except KeyError:
             raise AttributeError(f'"{self.__class__.__name__}" object has no attribute "{key}"') from None
-
-    def __setattr__(self, key: str, value: Any) -> None:
-        self[key] = value
-
-    def __delattr__(self, key: str) -> None:
-        del self[key]
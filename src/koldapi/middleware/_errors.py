@@ -25,6 +25,8 @@ class ServerErrorMiddleware(MiddlewareBase):
         status_code: Status code to return.
     """
 
+    __slots__ = ("config",)
+
     status_code: ClassVar[Status] = Status.HTTP_500_INTERNAL_SERVER_ERROR
 
     def __init__(self, app: ASGIApp, config: Config, /) -> None:
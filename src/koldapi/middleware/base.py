@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from typing import Generic, TypeVar, cast
 
 from koldapi._types import ASGIApp, Receive, Scope, Send
 
@@ -12,6 +12,8 @@ class MiddlewareBase(ABC):
     It can perform pre-processing, post-processing, or handle exceptions.
     """
 
+    __slots__ = ("app",)
+
     def __init__(self, app: ASGIApp, /, *args, **kwargs) -> None:
         """
         Initialize the middleware with the next ASGI app in the chain.
@@ -57,6 +59,25 @@ class NextMiddleware(MiddlewareBase, ABC):
     Use this if you want to implement middleware without manually calling `self.app`.
     """
 
+    __slots__ = ("_dispatch", "_next")
+
+    def __init__(self, app: ASGIApp, /, *args, **kwargs) -> None:
+        """
+        Initialize the middleware and pre-bind the per-call lookups.
+
+        The bound dispatch method and the next app are stashed in slots so
+        __call__ loads each through one fixed-offset read instead of a
+        method bind plus attribute probe per request.
+
+        Args:
+            app: The ASGI application or middleware to wrap.
+            args: Optional additional positional arguments for subclasses.
+            kwargs: Optional additional named arguments for subclasses.
+        """
+        super().__init__(app, *args, **kwargs)
+        self._dispatch = self.dispatch
+        self._next = app
+
     async def __call__(self, scope: Scope, receive: Receive, send: Send, /) -> None:
         """
         Call `dispatch` and then automatically forward the request to the next app.
@@ -78,8 +99,40 @@ class NextMiddleware(MiddlewareBase, ABC):
             >>>        print(f"[LOG] Incoming request: {scope['method']} {scope['path']}")
             >>>        # No need to call self.app here — NextMiddleware will handle it
         """
-        await super().__call__(scope, receive, send)
-        await self.app(scope, receive, send)
+        await self._dispatch(scope, receive, send)
+        await self._next(scope, receive, send)
+
+
+def _flatten_next_middleware(middleware: NextMiddleware, app: ASGIApp, /) -> ASGIApp:
+    """
+    Collapse a plain ``NextMiddleware`` layer into a flat coroutine.
+
+    A NextMiddleware that does not override ``__call__`` always runs its
+    ``dispatch`` and then the next app. Merging consecutive such layers into
+    a single closure over a tuple of dispatch callables removes one coroutine
+    frame and one await hop per layer per request.
+
+    Args:
+        middleware: The instantiated middleware layer to fold in.
+        app: The next ASGI app in the chain (possibly already flattened).
+
+    Returns:
+        ASGIApp: A single callable running all folded dispatches in order,
+            then the innermost app.
+    """
+    # The marker attributes are namespaced so an arbitrary inner ASGI app
+    # that happens to define e.g. "_tail" is never mistaken for a stack.
+    dispatches: tuple = (middleware.dispatch, *getattr(app, "_koldapi_dispatches", ()))
+    tail: ASGIApp = getattr(app, "_koldapi_tail", app)
+
+    async def stack(scope: Scope, receive: Receive, send: Send, /) -> None:
+        for dispatch in dispatches:
+            await dispatch(scope, receive, send)
+        await tail(scope, receive, send)
+
+    stack._koldapi_dispatches = dispatches  # type: ignore[attr-defined]
+    stack._koldapi_tail = tail  # type: ignore[attr-defined]
+    return stack
 
 
 T = TypeVar("T", bound="MiddlewareBase")
@@ -93,6 +146,8 @@ class Middleware(Generic[T]):
     and instantiate them when building the middleware stack.
     """
 
+    __slots__ = ("args", "cls", "kwargs")
+
     def __init__(self, cls: type[T], *args, **kwargs) -> None:
         """
         Store the middleware class and its constructor arguments.
@@ -117,3 +172,34 @@ class Middleware(Generic[T]):
             An instance of the middleware wrapping the provided app.
         """
         return self.cls(app, *self.args, **self.kwargs)
+
+    @classmethod
+    def build_chain(cls, middlewares: list["Middleware"], root: ASGIApp, /) -> ASGIApp:
+        """
+        Fold a middleware list around a root app into one ASGI callable.
+
+        Layers are applied right to left so the first list item ends up
+        outermost. Plain pass-through layers (``NextMiddleware`` subclasses
+        that keep the default ``__call__``) are folded into a single closure
+        instead of stacking another coroutine frame per request.
+
+        Args:
+            middlewares: Middleware definitions, outermost first.
+            root: The innermost ASGI app the chain wraps.
+
+        Returns:
+            ASGIApp: The composed application.
+        """
+        app: ASGIApp = root
+
+        middleware: Middleware
+        for middleware in reversed(middlewares):
+            instance: MiddlewareBase = middleware(app)
+            if type(instance).__call__ is NextMiddleware.__call__:
+                # Only NextMiddleware subclasses can inherit its __call__,
+                # so the identity check above guarantees the cast.
+                app = _flatten_next_middleware(cast("NextMiddleware", instance), app)
+            else:
+                app = instance
+
+        return app
@@ -1,9 +1,26 @@
-from collections.abc import Iterator, Mapping
+from collections.abc import ItemsView, Iterator, KeysView, Mapping, ValuesView
+from functools import lru_cache
 from typing import Any, ClassVar
 
 from koldapi._types import Receive, Scope
 from koldapi.datastructures import Headers, Method, QueryParams
 
+# Both canonical and lowercase spellings of every method, so scope["method"]
+# resolves with one dict probe and no per-request string allocation.
+_METHOD_TABLE: dict[str, Method] = {method.value: method for method in Method}
+_METHOD_TABLE.update({method.value.lower(): method for method in Method})
+
+
+@lru_cache(maxsize=32)
+def _resolve_method(method_string: str, /) -> Method | None:
+    """
+    Resolve a scope method string to its Method member.
+
+    HTTP methods form a tiny closed set, so the LRU never evicts in practice
+    and repeated mixed-case spellings stop paying for ``upper`` as well.
+    """
+    return _METHOD_TABLE.get(method_string) or _METHOD_TABLE.get(method_string.upper())
+
 
 class BaseHTTPConnection(Exception):
     """Base HTTP Connection."""
@@ -17,7 +34,7 @@ class UnsupportedHTTPConnectionMethodError(BaseHTTPConnection):
     """Unsupported HTTP Connection Method Error."""
 
 
-class HTTPConnection(Mapping[str, Any]):
+class HTTPConnection:
     """
     Represents an HTTP connection in an ASGI application.
 
@@ -29,10 +46,14 @@ class HTTPConnection(Mapping[str, Any]):
             e.g. "http" and "websocket".
     """
 
-    _allowed_types: ClassVar[set[str]] = {
+    __slots__ = ("_headers", "_method", "_query_params", "_receive", "_scope")
+
+    # A short tuple beats a set here: membership is two C-level string
+    # comparisons with early exit, with no hash of the scope type per request.
+    _allowed_types: ClassVar[tuple[str, ...]] = (
         "http",
         "websocket",
-    }
+    )
 
     def __init__(self, scope: Scope, receive: Receive, /):
         """
@@ -50,7 +71,10 @@ class HTTPConnection(Mapping[str, Any]):
 
         self._validate_connection()
 
-        self._headers: Headers = Headers.from_scope(scope)
+        # Built lazily on first access; many handlers never touch headers, so
+        # constructing a connection stays O(1) in the header count.
+        self._headers: Headers | None = None
+        self._method: Method | None = None
         self._query_params: QueryParams = QueryParams.from_scope(scope)
 
     def _validate_connection(self) -> None:
@@ -71,6 +95,8 @@ class HTTPConnection(Mapping[str, Any]):
         Returns:
             The HTTP headers extracted from the ASGI scope.
         """
+        if self._headers is None:
+            self._headers = Headers.from_scope(self._scope)
         return self._headers
 
     @property
@@ -101,11 +127,13 @@ class HTTPConnection(Mapping[str, Any]):
         Returns:
             The HTTP method (e.g., ``Method.GET``, ``Method.POST``).
         """
-        method: str = self._scope["method"]
-        try:
-            return Method(method.upper())
-        except ValueError:
-            raise UnsupportedHTTPConnectionMethodError() from None
+        method: Method | None = self._method
+        if method is None:
+            method = _resolve_method(self._scope["method"])
+            if method is None:
+                raise UnsupportedHTTPConnectionMethodError()
+            self._method = method
+        return method
 
     @property
     def scope(self) -> Scope:
@@ -130,6 +158,23 @@ class HTTPConnection(Mapping[str, Any]):
         """
         return self._receive
 
+    # Mapping-style access forwards straight to the scope dict so reads stay
+    # at C level instead of going through the abc.Mapping mixin frames.
+    def get(self, key: str, default: Any = None, /) -> Any:
+        return self._scope.get(key, default)
+
+    def keys(self) -> KeysView[str]:
+        return self._scope.keys()
+
+    def values(self) -> ValuesView[Any]:
+        return self._scope.values()
+
+    def items(self) -> ItemsView[str, Any]:
+        return self._scope.items()
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._scope
+
     def __getitem__(self, key: str) -> Any:
         return self._scope[key]
 
@@ -138,3 +183,8 @@ class HTTPConnection(Mapping[str, Any]):
 
     def __len__(self) -> int:
         return len(self._scope)
+
+
+# Registered virtually so isinstance(connection, Mapping) keeps working for
+# user code without inheriting the Python-level mixin implementations.
+Mapping.register(HTTPConnection)
@@ -1,7 +1,11 @@
 import json
-from json import JSONDecodeError
 from typing import TYPE_CHECKING, Any, ClassVar
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 from koldapi._types import Receive, Scope
 
 from .http_connection import BaseHTTPConnection, HTTPConnection
@@ -21,9 +25,9 @@ class Request(HTTPConnection):
     Extends HTTPConnection.
     """
 
-    allowed_types: ClassVar[set[str]] = {
-        "http",
-    }
+    __slots__ = ("_body", "_json")
+
+    allowed_types: ClassVar[tuple[str, ...]] = ("http",)
 
     def __init__(self, scope: Scope, receive: Receive, /) -> None:
         """
@@ -53,13 +57,24 @@ class Request(HTTPConnection):
         if self._body is not None:
             return self._body
 
-        chunks: list[bytes] = []
+        message: MutableMapping[str, Any] = await self._receive()
+        body: bytes = message.get("body", b"")
+        if not message.get("more_body", False):
+            # Overwhelmingly the common case: the whole body arrives in one
+            # message, so it can be cached as-is with no copy at all.
+            self._body = body
+            return body
+
+        # A single resizable buffer instead of a chunk list plus join:
+        # bytearray grows geometrically, so large streamed bodies touch one
+        # contiguous allocation rather than N small bytes objects.
+        buffer: bytearray = bytearray(body)
         while True:
-            message: MutableMapping[str, Any] = await self._receive()
-            chunks.append(message.get("body", b""))
+            message = await self._receive()
+            buffer += message.get("body", b"")
             if not message.get("more_body", False):
                 break
-        self._body = b"".join(chunks)
+        self._body = bytes(buffer)
         return self._body
 
     async def json(self) -> dict[str, Any]:
@@ -79,8 +94,9 @@ class Request(HTTPConnection):
             return self._json
 
         body: bytes = await self.body()
+        # Both parsers raise a ValueError subclass on malformed input.
         try:
-            self._json = json.loads(body)
-        except JSONDecodeError:
+            self._json = orjson.loads(body) if orjson is not None else json.loads(body)
+        except ValueError:
             raise WrongHTTPBodyFormatError() from None
         return self._json
@@ -1,8 +1,20 @@
+import sys
 from typing import Any, ClassVar
 
 from koldapi._types import Receive, Scope, Send
 from koldapi.datastructures import Headers, Status
 
+# Interned once so the per-response header writes hash pointer-identical
+# key objects instead of re-hashing fresh literals.
+_CONTENT_TYPE_KEY: str = sys.intern("content-type")
+_CONTENT_LENGTH_KEY: str = sys.intern("content-length")
+
+# Media types form a tiny closed set in practice, so whether a charset is
+# needed and the full Content-Type header value are memoized per media type
+# instead of re-running the prefix/substring scans for every response.
+_CHARSET_REQUIRED: dict[str, bool] = {}
+_CONTENT_TYPE_CACHE: dict[tuple[str, str], str] = {}
+
 
 class BaseResponseError(Exception):
     """Base Response Error."""
@@ -36,15 +48,25 @@ class Response:
     ) -> None:
         self._content: Any | None = content
         self.status_code: Status = status_code
+        # Computed once; construction and header population consult this up
+        # to four times per response.
+        self._body_not_allowed: bool = Status.body_not_allowed(status_code)
         self.media_type: str | None = self._get_media_type(media_type)
 
         self.validate_empty_response()
 
-        self._body: bytes | memoryview | None = None
+        # Serialized eagerly: the content-length header needs the body size
+        # anyway, so rendering once here means __call__ and __len__ are plain
+        # attribute reads.
+        self._body: bytes | memoryview = self.serialize_content()
 
         self.headers: Headers = headers or Headers()
         self._populate_headers()
 
+        # ASGI event dicts, built on first send and reused afterwards.
+        self._start_message: dict[str, Any] | None = None
+        self._body_message: dict[str, Any] | None = None
+
     def validate_empty_response(self) -> None:
         """
         Validate the response.
@@ -52,7 +74,10 @@ class Response:
         Raises:
             IncorrectResponseStatusCodeError: If content set when status_code doesn't imply the body.
         """
-        if Status.body_not_allowed(self.status_code) and self.content:
+        if self._content is None:
+            # Bodyless responses are always valid; skip the status check.
+            return
+        if self._body_not_allowed and self._content:
             raise IncorrectResponseStatusCodeError(f"Content is not allowed for status_code={self.status_code}")
 
     def _get_media_type(self, media_type: str | None, /) -> str | None:
@@ -85,7 +110,7 @@ class Response:
         if not self.content:
             return False
 
-        return not Status.body_not_allowed(self.status_code)
+        return not self._body_not_allowed
 
     @property
     def content_type_required(self) -> bool:
@@ -95,7 +120,7 @@ class Response:
         Returns:
             True if content type is required and False otherwise.
         """
-        return not Status.body_not_allowed(self.status_code) and "content-type" not in self.headers
+        return not self._body_not_allowed and _CONTENT_TYPE_KEY not in self.headers
 
     @property
     def content_type(self) -> str | None:
@@ -107,9 +132,17 @@ class Response:
         Returns:
             The Content-Type header string, e.g. "text/plain; charset=utf-8".
         """
-        content_type: str | None = self.media_type
-        if content_type and self.charset_required:
-            content_type += "; charset=" + self.charset
+        media_type: str | None = self.media_type
+        if not media_type:
+            return media_type
+
+        cache_key: tuple[str, str] = (media_type, self.charset)
+        content_type: str | None = _CONTENT_TYPE_CACHE.get(cache_key)
+        if content_type is None:
+            content_type = media_type
+            if self.charset_required:
+                content_type += "; charset=" + self.charset
+            _CONTENT_TYPE_CACHE[cache_key] = content_type
         return content_type
 
     @property
@@ -121,9 +154,15 @@ class Response:
             True if the media type is a text-based type (starts with "text/")
                 and does not already specify a charset; False otherwise.
         """
-        if not self.media_type:
+        media_type: str | None = self.media_type
+        if not media_type:
             return False
-        return self.media_type.startswith("text/") and "charset=" not in self.media_type
+
+        required: bool | None = _CHARSET_REQUIRED.get(media_type)
+        if required is None:
+            required = media_type.startswith("text/") and "charset=" not in media_type
+            _CHARSET_REQUIRED[media_type] = required
+        return required
 
     def _populate_headers(self) -> None:
         """
@@ -131,10 +170,10 @@ class Response:
         """
         content_type: str | None = self.content_type
         if content_type and self.content_type_required:
-            self.headers["content-type"] = content_type
+            self.headers[_CONTENT_TYPE_KEY] = content_type
 
         if self.content_length_required:
-            self.headers["content-length"] = str(len(self))
+            self.headers[_CONTENT_LENGTH_KEY] = str(len(self._body))
 
     def serialize_content(self) -> bytes | memoryview:
         """
@@ -153,21 +192,46 @@ class Response:
     def render(self) -> bytes | memoryview:
         """
         Render the response for the ASGI server.
-        If the body already calculated then return cache.
+        The body is serialized once at construction time.
 
         Returns:
             The response body as bytes or a memoryview.
                 Returns empty bytes if no content is set.
         """
-        if self._body is not None:
-            return self._body
-
-        self._body = self.serialize_content()
         return self._body
 
     def __len__(self) -> int:
         return len(self.render())
 
+    def render_messages(self) -> tuple[dict[str, Any], dict[str, Any]]:
+        """
+        Return the start and body ASGI events for this response.
+
+        Built on first use and cached. Exposed so servers or custom writers
+        that can coalesce both events may drain them without going through
+        __call__; the ASGI spec still requires sending start before body.
+
+        Returns:
+            The http.response.start and http.response.body event dicts.
+        """
+        start_message: dict[str, Any] | None = self._start_message
+        if start_message is None:
+            # Built on first send rather than in __init__ so headers mutated
+            # after construction still make it onto the wire; int() once here
+            # spares the ASGI server repeated IntEnum coercion.
+            start_message = {
+                "type": "http.response.start",
+                "status": int(self.status_code),
+                "headers": self.headers.raw,
+            }
+            self._start_message = start_message
+            self._body_message = {
+                "type": "http.response.body",
+                "body": self._body,
+            }
+
+        return start_message, self._body_message  # type: ignore[return-value]
+
     async def __call__(self, scope: Scope, receive: Receive, send: Send, /) -> None:
         """
         Send the HTTP response start event with the configured data.
@@ -177,16 +241,9 @@ class Response:
             receive: ASGI callable to receive events.
             send: ASGI callable to send events.
         """
-        await send(
-            {
-                "type": "http.response.start",
-                "status": self.status_code,
-                "headers": self.headers.raw,
-            }
-        )
-        await send(
-            {
-                "type": "http.response.body",
-                "body": self.render(),
-            }
-        )
+        start_message: dict[str, Any]
+        body_message: dict[str, Any]
+        start_message, body_message = self.render_messages()
+
+        await send(start_message)
+        await send(body_message)
@@ -1,4 +1,5 @@
 import json
+from typing import Any
 
 from .base import Response
 
@@ -12,8 +13,8 @@ class JSONResponse(Response):
 
     Example:
         >>> response = JSONResponse({"key": "value"})
-        >>> response.serialize_content()
-        b'{"key": "value"}'
+        >>> json.loads(response.serialize_content())
+        {'key': 'value'}
     """
 
     media_type = "application/json"
@@ -28,4 +29,6 @@ class JSONResponse(Response):
         Returns:
             bytes | memoryview: The JSON-encoded response body.
         """
-        return json.dumps(self.content or {}, ensure_ascii=False).encode(encoding=self.charset)
+        content: Any = self.content or {}
+
+        return json.dumps(content, ensure_ascii=False).encode(encoding=self.charset)
@@ -3,12 +3,39 @@ from typing import TYPE_CHECKING, Any
 
 from koldapi._types import Lifespan, Receive, Scope, Send
 from koldapi.configs import Config
-from koldapi.routing.routes import BaseRoute, Match
+from koldapi.routing.routes import BaseRoute, Match, Route
+from koldapi.routing.routes._base import _PARAM_SEGMENT_REGEX, _split_path
 
 if TYPE_CHECKING:
+    import re
     from collections.abc import Mapping
     from contextlib import AbstractAsyncContextManager
 
+# Direct-mapped hot cache geometry: a power-of-two slot count makes the
+# index a single AND off the key hash. Collisions simply overwrite - under
+# real traffic a handful of URLs dominates, and a stale slot just means one
+# re-resolution through the normal tables.
+_HOT_SLOTS: int = 256
+_HOT_MASK: int = _HOT_SLOTS - 1
+
+
+class _RadixNode:
+    """One segment-level node of the routing trie.
+
+    Exact-segment children take priority over the parameter child, so
+    /users/list wins over /users/{id} regardless of registration order.
+    """
+
+    __slots__ = ("children", "methods", "param_child", "param_name")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _RadixNode] = {}
+        self.param_child: _RadixNode | None = None
+        self.param_name: str | None = None
+        # Leaf table keyed by HTTP method; Method members hash as their
+        # string values, so raw scope["method"] strings hit directly.
+        self.methods: dict[str, Route] = {}
+
 
 class Router:
     """
@@ -32,6 +59,17 @@ class Router:
         self.routes: list[BaseRoute] = routes or []
         self.lifespan_context: Lifespan[Any] = lifespan_context
 
+        # Lazily frozen (method, path) -> route table for static routes,
+        # rebuilt on first dispatch after the route table changes.
+        self._static_routes: dict[tuple[str, str], BaseRoute] | None = None
+        # Segment-level radix trie over parameterized routes; dispatch walks
+        # it in O(len(path)) independent of how many routes are registered.
+        self._trie: _RadixNode | None = None
+        # Direct-mapped cache of resolved (method, path) pairs; for a fixed
+        # route table the winning route and its params are deterministic, so
+        # hot URLs resolve with one hash and one key comparison.
+        self._hot: list[tuple[tuple[str, str], BaseRoute, dict[str, str]] | None] = [None] * _HOT_SLOTS
+
     def add_route(self, route: BaseRoute, /) -> None:
         """
         Add a route to the router.
@@ -40,6 +78,221 @@ class Router:
             route: The route to be added.
         """
         self.routes.append(route)
+        self._static_routes = None
+        self._hot = [None] * _HOT_SLOTS
+
+    def _freeze(self) -> dict[tuple[str, str], BaseRoute]:
+        """
+        Build the static dispatch table.
+
+        Routes without path parameters resolve with a single dict lookup on
+        (method, path) instead of a linear scan; parameterized routes and
+        partial (method mismatch) detection stay on the scan fallback.
+
+        Returns:
+            The (method, path) -> route table, also cached on the router.
+        """
+        static_routes: dict[tuple[str, str], BaseRoute] = {}
+        trie: _RadixNode | None = None
+        # Dynamic routes the trie cannot express, in registration order. The
+        # trie runs before the linear scan, so a later trie-eligible route
+        # that could match the same paths as one of these must not jump
+        # ahead of it; it is demoted to the scan as well.
+        scan_routes: list[Route] = []
+
+        route: BaseRoute
+        for route in self.routes:
+            if not isinstance(route, Route):
+                continue
+            if route.is_static:
+                for method in route.methods:
+                    static_routes.setdefault((method, route.path), route)
+                continue
+
+            if any(self._overlaps(route, scan_route) for scan_route in scan_routes):
+                scan_routes.append(route)
+                continue
+
+            if trie is None:
+                trie = _RadixNode()
+            if not self._insert(trie, route):
+                # Mixed segments or a param-name conflict cannot be expressed
+                # as trie edges; the route stays on the linear-scan fallback.
+                scan_routes.append(route)
+
+        self._trie = trie
+        self._static_routes = static_routes
+        return static_routes
+
+    @staticmethod
+    def _overlaps(route: Route, other: Route, /) -> bool:
+        """
+        Conservatively decide whether two templates can match the same path.
+
+        Segment pairs where either side carries a placeholder are treated as
+        compatible without inspecting the patterns; a false positive only
+        costs one route its trie slot, never correctness.
+
+        Args:
+            route: The candidate route.
+            other: The route it is compared against.
+
+        Returns:
+            True when the templates may both match some request.
+        """
+        if not route.methods_mask & other.methods_mask:
+            return False
+
+        segments: list[str] = route.path.split("/")[1:]
+        other_segments: list[str] = other.path.split("/")[1:]
+        if len(segments) != len(other_segments):
+            return False
+
+        for segment, other_segment in zip(segments, other_segments, strict=True):
+            if "{" not in segment and "{" not in other_segment and segment != other_segment:
+                return False
+        return True
+
+    @staticmethod
+    def _insert(trie: _RadixNode, route: Route, /) -> bool:
+        """
+        Insert a parameterized route into the trie.
+
+        Args:
+            trie: The trie root.
+            route: The route to insert.
+
+        Returns:
+            True when every segment mapped onto a trie edge; False when the
+                route must stay on the linear-scan fallback.
+        """
+        node: _RadixNode = trie
+        for segment in route.path.split("/")[1:]:
+            param_match: re.Match[str] | None = _PARAM_SEGMENT_REGEX.match(segment)
+            if param_match is None:
+                if "{" in segment:
+                    # Mixed segments such as "v{version}" need the regex; an
+                    # exact literal edge would swallow them without params.
+                    return False
+                node = node.children.setdefault(segment, _RadixNode())
+                continue
+
+            name: str = param_match.group(1)
+            param_child: _RadixNode | None = node.param_child
+            if param_child is None:
+                param_child = _RadixNode()
+                param_child.param_name = name
+                node.param_child = param_child
+            elif param_child.param_name != name:
+                return False
+            node = param_child
+
+        for method in route.methods:
+            node.methods.setdefault(method, route)
+        return True
+
+    def _match_trie(self, scope: Scope, /) -> Route | None:
+        """
+        Walk the trie along the request path's segments.
+
+        On a full match the extracted path params are written into the scope
+        and the winning route is returned. A path-only (wrong method) match
+        returns None so the linear scan below can handle partial semantics
+        and later full matches.
+
+        Args:
+            scope: The ASGI connection scope.
+
+        Returns:
+            The matched route, or None when the scan fallback should run.
+        """
+        node: _RadixNode | None = self._trie
+        if node is None:
+            return None
+
+        params: dict[str, str] | None = None
+        segment: str
+        for segment in _split_path(scope["path"]):
+            child: _RadixNode | None = node.children.get(segment)
+            if child is None:
+                child = node.param_child
+                # Params capture [^/]+; an empty segment never matches one.
+                if child is None or not segment:
+                    return None
+                if params is None:
+                    params = {}
+                params[child.param_name] = segment  # type: ignore[index]
+            node = child
+
+        route: Route | None = node.methods.get(scope["method"])
+        if route is None:
+            return None
+
+        existing: dict[str, str] | None = scope.get("path_params")
+        if existing:
+            scope["path_params"] = {**existing, **params} if params else {**existing}
+        else:
+            scope["path_params"] = params if params is not None else {}
+        return route
+
+    async def _dispatch_fast(self, scope: Scope, receive: Receive, send: Send, /) -> bool:
+        """
+        Resolve the request through the hot cache, static table and trie.
+
+        Args:
+            scope: The ASGI connection scope.
+            receive: Awaitable callable to receive ASGI events from the server.
+            send: Awaitable callable to send ASGI events back to the server.
+
+        Returns:
+            True when the request was dispatched; False when the linear scan
+                fallback should run.
+        """
+        static_routes: dict[tuple[str, str], BaseRoute] | None = self._static_routes
+        if static_routes is None:
+            static_routes = self._freeze()
+
+        cache_key: tuple[str, str] | None = None
+        slot: int = 0
+        if static_routes or self._trie is not None:
+            cache_key = (scope["method"], scope["path"])
+            slot = hash(cache_key) & _HOT_MASK
+            entry: tuple[tuple[str, str], BaseRoute, dict[str, str]] | None = self._hot[slot]
+            if entry is not None and entry[0] == cache_key:
+                cached_params: dict[str, str] = entry[2]
+                if cached_params:
+                    # Copy on hit: the dispatched endpoint may mutate its
+                    # params.
+                    scope["path_params"] = {**cached_params}
+                else:
+                    # An empty entry means a static route; keep any inherited
+                    # params instead of clobbering them with {}.
+                    scope.setdefault("path_params", {})
+                await entry[1](self.config, scope, receive, send)
+                return True
+
+        if static_routes:
+            static_route: BaseRoute | None = static_routes.get((scope["method"], scope["path"]))
+            if static_route is not None:
+                if not scope.setdefault("path_params", {}) and cache_key is not None:
+                    # Inherited params are per-request state; only a
+                    # self-contained match is safe to replay for other
+                    # requests, same as the trie branch below.
+                    self._hot[slot] = (cache_key, static_route, {})
+                await static_route(self.config, scope, receive, send)
+                return True
+
+        inherited_params: dict[str, str] | None = scope.get("path_params")
+        dynamic_route: Route | None = self._match_trie(scope)
+        if dynamic_route is not None:
+            if cache_key is not None and not inherited_params:
+                # Inherited params are per-request state; only a self-contained
+                # match is safe to replay for other requests.
+                self._hot[slot] = (cache_key, dynamic_route, dict(scope["path_params"]))
+            await dynamic_route(self.config, scope, receive, send)
+            return True
+
+        return False
 
     async def _lifespan(
         self,
@@ -115,6 +368,9 @@ class Router:
             await self._lifespan(scope, receive, send)
             return
 
+        if await self._dispatch_fast(scope, receive, send):
+            return
+
         partial_route: BaseRoute | None = None
         route: BaseRoute
         for route in self.routes:
@@ -127,15 +383,19 @@ class Router:
             #   can be used.
             # Note: BaseRoute does not handle partial matches; this logic is managed by the router.
             match: Match
-            child_scope: Scope
+            child_scope: Mapping[str, Any]
             match, child_scope = route.matches(scope)
 
-            if match == Match.FULL:
-                scope.update(child_scope)
+            if match is Match.FULL:
+                # The delta scope carries at most path_params; assign it
+                # directly instead of a generic dict merge.
+                path_params: dict[str, str] | None = child_scope.get("path_params")
+                if path_params is not None:
+                    scope["path_params"] = path_params
                 await route(self.config, scope, receive, send)
                 return
 
-            elif match == Match.PARTIAL and partial_route is None:
+            elif match is Match.PARTIAL and partial_route is None:
                 partial_route = route
                 partial_scope = child_scope  # noqa: F841
 
@@ -4,9 +4,14 @@ import inspect
 import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from enum import StrEnum
+from enum import IntEnum
+from functools import lru_cache
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, ClassVar
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
 if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
 
@@ -16,10 +21,13 @@ if TYPE_CHECKING:
     from koldapi.responses import Response
 
 
-class Match(StrEnum):
+class Match(IntEnum):
     """
     Represents the result of a route matching attempt.
 
+    An IntEnum: members compare with plain integer comparison in the
+    router's dispatch loop instead of string equality.
+
     Attributes:
         NONE: No match — the route's path does not match the incoming request.
         PARTIAL: Partial match — the route's path matches, but other criteria
@@ -27,9 +35,9 @@ class Match(StrEnum):
         FULL: Full match — both the route's path and all criteria match the request.
     """
 
-    NONE = "NONE"
-    PARTIAL = "PARTIAL"
-    FULL = "FULL"
+    NONE = 0
+    PARTIAL = 1
+    FULL = 2
 
 
 class BaseRouteError(Exception):
@@ -44,7 +52,7 @@ class InvalidRequestTypeError(BaseRouteError):
     """Invalid Request Type Error."""
 
 
-@dataclass
+@dataclass(slots=True)
 class ParamError:
     """
     Represents an error that occurred while trying to convert or validate a parameter
@@ -80,9 +88,199 @@ class InvalidPathParamsError(BaseRouteError):
         return "; ".join(f"{err.loc}: {err.msg}" for err in self.errors)
 
 
+def _endpoint_params(endpoint: Callable, /) -> tuple[tuple[str, ...], dict[str, Any]]:
+    """
+    Read an endpoint's parameter names and annotations.
+
+    Plain functions are read straight off the code object, which skips
+    inspect.signature's Parameter construction at registration time.
+    Callables without a usable code object (partials, callable instances,
+    mocks) fall back to inspect.
+
+    Args:
+        endpoint: The request handler.
+
+    Returns:
+        The parameter names in declaration order and the raw annotations.
+    """
+    func: Callable = endpoint
+    skip: int = 0
+    if inspect.ismethod(endpoint):
+        func = endpoint.__func__
+        skip = 1  # Drop the bound "self" like inspect.signature does.
+    # functools.wraps leaves the wrapper's (*args, **kwargs) code object in
+    # place; follow __wrapped__ to the real endpoint like inspect.signature.
+    func = inspect.unwrap(func)
+
+    try:
+        code = func.__code__
+        names: tuple[str, ...] = tuple(code.co_varnames[skip : code.co_argcount + code.co_kwonlyargcount])
+        annotations: dict[str, Any] = dict(getattr(func, "__annotations__", None) or {})
+    except (AttributeError, TypeError):
+        signature: inspect.Signature = inspect.signature(endpoint)
+        names = tuple(signature.parameters)
+        annotations = {
+            name: param.annotation
+            for name, param in signature.parameters.items()
+            if param.annotation is not inspect._empty
+        }
+
+    return names, annotations
+
+
+# A path segment that is exactly one {name} placeholder; mixed segments such
+# as "v{version}" cannot be segment-matched and stay on the regex.
+_PARAM_SEGMENT_REGEX: re.Pattern[str] = re.compile(r"^\{([a-zA-Z_][a-zA-Z0-9_]*)\}$")
+
+
+@lru_cache(maxsize=1024)
+def _split_path(path: str, /) -> tuple[str, ...]:
+    """
+    Split a request path into its segments, without the leading empty slice.
+
+    Cached: hot URLs repeat, and the split result is method- and
+    route-agnostic so one entry serves every consumer of the same path.
+
+    Args:
+        path: The request path, e.g. "/users/42".
+
+    Returns:
+        The path segments, e.g. ("users", "42").
+    """
+    return tuple(path.split("/")[1:])
+
+
+# Characters that mean something to the regex engine. Literal path segments
+# are overwhelmingly free of them, so escaping is gated on a C-level
+# isdisjoint check instead of running re.escape unconditionally.
+_REGEX_META: frozenset[str] = frozenset(".^$*+?()[]{}|\\")
+
+
+def _escape_literal(segment: str, /) -> str:
+    """Escape a literal path segment only if it contains regex metacharacters."""
+    return segment if _REGEX_META.isdisjoint(segment) else re.escape(segment)
+
+
+@lru_cache(maxsize=1024)
+def _compile_path(path: str, param_regex: str, /) -> tuple[re.Pattern[str], tuple[str, ...]]:
+    """
+    Compile a path template into its regex and parameter names.
+
+    Cached globally: the same template is frequently registered more than
+    once (sub-routers, app reconstruction in tests), and compilation is the
+    expensive part of building a route.
+
+    Args:
+        path: The path template, e.g. "/users/{id}".
+        param_regex: The placeholder pattern to substitute.
+
+    Returns:
+        The compiled pattern and the parameter names in template order.
+    """
+    param_names: list[str] = []
+    parts: list[str] = ["^"]
+    end: int = 0
+
+    # One finditer pass builds the pattern and collects the names together,
+    # without re.sub's per-placeholder Python callback. Literal segments are
+    # escaped - only when needed - so path characters regex treats specially
+    # stay literal.
+    match: re.Match[str]
+    for match in re.finditer(param_regex, path):
+        name: str = match.group(1)
+        param_names.append(name)
+        parts.append(_escape_literal(path[end : match.start()]))
+        parts.append(f"(?P<{name}>[^/]+)")
+        end = match.end()
+    parts.append(_escape_literal(path[end:]))
+    parts.append("$")
+
+    # re.ASCII keeps the pattern byte-oriented - path templates are ASCII -
+    # which avoids dragging Unicode tables into the matcher.
+    return re.compile("".join(parts), re.ASCII), tuple(param_names)
+
+
+def _specialize_kwargs_builder(
+    params: tuple[tuple[str, Any], ...],
+    /,
+) -> Callable[[dict[str, str]], dict[str, Any]]:
+    """
+    Build a kwargs-assembly function specialized for one endpoint signature.
+
+    The returned closure captures the parameter names and cast callables as
+    locals, so the per-request work is a dict comprehension (plus the cast
+    loop only when annotations actually require conversion) instead of a
+    generic walk over the signature with per-parameter branching.
+
+    Args:
+        params: Flattened (name, annotation-or-None) pairs for the endpoint.
+
+    Returns:
+        A callable mapping the request's path params to endpoint kwargs.
+
+    Raises:
+        InvalidPathParamsError: Raised by the closure when a cast fails.
+    """
+    plain_names: tuple[str, ...] = tuple(name for name, annotation in params if annotation is None)
+    casts: tuple[tuple[str, Any], ...] = tuple(
+        (name, annotation) for name, annotation in params if annotation is not None
+    )
+
+    if not casts:
+
+        def build_plain(path_params: dict[str, str], /) -> dict[str, Any]:
+            return {name: path_params[name] for name in plain_names if name in path_params}
+
+        return build_plain
+
+    def build(path_params: dict[str, str], /) -> dict[str, Any]:
+        kwargs: dict[str, Any] = {name: path_params[name] for name in plain_names if name in path_params}
+        errors: list[ParamError] = []
+
+        for name, annotation in casts:
+            if name not in path_params:
+                continue
+            value: Any = path_params[name]
+            try:
+                value = annotation(value)
+            except Exception:  # noqa: BLE001
+                errors.append(
+                    ParamError(
+                        loc=["path", name],
+                        msg=f"Can't convert to {annotation.__name__}",
+                        type=f"type_error.{annotation.__name__}",
+                    )
+                )
+            kwargs[name] = value
+
+        if errors:
+            raise InvalidPathParamsError(errors)
+
+        return kwargs
+
+    return build
+
+
 class BaseRoute(ABC):
+    __slots__ = (
+        "_endpoint_annotations",
+        "_endpoint_param_names",
+        "_has_param_inputs",
+        "_kwargs_builder",
+        "_match",
+        "_params",
+        "endpoint",
+        "param_names",
+        "path",
+        "regex",
+    )
+
     _param_regex: ClassVar[str] = r"{([a-zA-Z_][a-zA-Z0-9_]*)}"
 
+    # Shared read-only scope handed back on misses so a non-matching route
+    # never allocates; callers must not mutate a NONE result.
+    _EMPTY_SCOPE: ClassVar[Mapping[str, Any]] = MappingProxyType({})
+
     def __init__(self, path: str, endpoint: Callable, /) -> None:
         """
         Abstract base class representing a route definition.
@@ -96,10 +294,24 @@ class BaseRoute(ABC):
         self.endpoint: Callable[..., Response | Awaitable[Response]] = endpoint
 
         self.regex, self.param_names = self.compile_path(path)
-        self.endpoint_signature: inspect.Signature = inspect.signature(self.endpoint)
+        # Bound once; the hot path calls self._match without re-resolving the
+        # method through the pattern object's descriptor each request.
+        self._match: Callable[[str], re.Match[str] | None] = self.regex.match
+        names, annotations = _endpoint_params(endpoint)
+        self._endpoint_param_names: tuple[str, ...] = names
+        self._endpoint_annotations: dict[str, Any] = annotations
+        # Flattened (name, annotation-or-None) pairs; None marks params that
+        # need no cast, so the per-request loop skips the inspect machinery.
+        self._params: tuple[tuple[str, Any], ...] = tuple(
+            (name, None if annotations.get(name, str) is str else annotations[name]) for name in names
+        )
+        self._kwargs_builder: Callable[[dict[str, str]], dict[str, Any]] = _specialize_kwargs_builder(self._params)
+        # Endpoints that accept no parameters at all skip kwargs assembly
+        # entirely on dispatch.
+        self._has_param_inputs: bool = bool(self._params)
 
     @abstractmethod
-    def matches(self, scope: Scope, /) -> tuple[Match, Scope]:
+    def matches(self, scope: Scope, /) -> tuple[Match, Mapping[str, Any]]:
         """
         Match the give path with the route's path.
 
@@ -107,7 +319,8 @@ class BaseRoute(ABC):
             scope: ASGI server scope.
 
         Returns:
-            Match type and scope.
+            Match type and the read-only delta scope; misses share the empty
+            sentinel mapping instead of allocating.
         """
 
     def build_endpoint_kwargs(self, connection: HTTPConnection, /) -> dict[str, Any]:
@@ -130,39 +343,16 @@ class BaseRoute(ABC):
         Raises:
             InvalidPathParamsError: if path parameters can't be cast to the requested type annotation.
         """
+        if not self._has_param_inputs:
+            return {}
+
         path_params: dict[str, str] | None = connection.scope.get("path_params")
         if not path_params:
             return {}
 
-        kwargs: dict[str, Any] = {}
-        errors: list[ParamError] = []
-
-        name: str
-        param: inspect.Parameter
-        for name, param in self.endpoint_signature.parameters.items():
-            if name not in path_params:
-                continue
-
-            value = path_params[name]
-            if param.annotation not in (inspect._empty, str):
-                try:
-                    value = param.annotation(value)
-                except Exception:  # noqa: BLE001
-                    errors.append(
-                        ParamError(
-                            loc=["path", name],
-                            msg=f"Can't convert to {param.annotation.__name__}",
-                            type=f"type_error.{param.annotation.__name__}",
-                        )
-                    )
-            kwargs[name] = value
-
-        if errors:
-            raise InvalidPathParamsError(errors)
-
-        return kwargs
+        return self._kwargs_builder(path_params)
 
-    def compile_path(self, path: str, /) -> tuple[re.Pattern[str], list[str]]:
+    def compile_path(self, path: str, /) -> tuple[re.Pattern[str], tuple[str, ...]]:
         """
         Convert a path with path params into a regex pattern.
 
@@ -175,15 +365,7 @@ class BaseRoute(ABC):
         Returns:
             Tuple of path pattern and parameter names.
         """
-        param_names: list[str] = []
-
-        def replace(match: re.Match, /) -> str:
-            name: str = match.group(1)
-            param_names.append(name)
-            return f"(?P<{name}>[^/]+)"
-
-        pattern: str = re.sub(self._param_regex, replace, path)
-        return re.compile(f"^{pattern}$"), param_names
+        return _compile_path(path, self._param_regex)
 
     @abstractmethod
     async def __call__(
@@ -1,17 +1,21 @@
+import asyncio
 import inspect
-from collections.abc import Awaitable, Callable
-from typing import TYPE_CHECKING, Any
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from typing import TYPE_CHECKING, Any, cast
 
 from koldapi._types import Receive, Scope, Send
 from koldapi.configs import Config
 from koldapi.datastructures import Method
+from koldapi.datastructures.methods import METHOD_BITS
 from koldapi.requests import HTTPConnection, Request
 from koldapi.responses import Response
 
 from ._base import (
+    _PARAM_SEGMENT_REGEX,
     BaseRoute,
     InvalidRequestTypeError,
     Match,
+    _split_path,
 )
 
 if TYPE_CHECKING:
@@ -19,51 +23,176 @@ if TYPE_CHECKING:
 
 
 class Route(BaseRoute):
-    def __init__(self, path: str, endpoint: Callable, methods: list[Method], /) -> None:
+    __slots__ = (
+        "_endpoint_is_async",
+        "_needs_request",
+        "_segments",
+        "is_static",
+        "methods",
+        "methods_mask",
+    )
+
+    def __init__(self, path: str, endpoint: Callable, methods: Sequence[Method], /) -> None:
         super().__init__(path, endpoint)
-        self.methods: list[Method] = methods
+        self.methods: tuple[Method, ...] = tuple(methods)
+        # Allowed methods folded into a bitmask; matches() then tests
+        # membership with one AND instead of scanning the tuple.
+        self.methods_mask: int = 0
+        for method in self.methods:
+            self.methods_mask |= METHOD_BITS[method]
+        # Static paths (no {param} placeholders) match by string equality and
+        # are indexed into the router's dispatch table.
+        self.is_static: bool = "{" not in path
+        # Prebuilt (is_param, literal-or-name) tokens; matches() walks them
+        # against the split path with no regex. None means some segment mixes
+        # literals and placeholders, which only the regex can express.
+        self._segments: tuple[tuple[bool, str], ...] | None = None if self.is_static else self._build_segments(path)
+        # Decided once at registration; asyncio's check also honours the
+        # _is_coroutine marker that wrapped/mocked endpoints carry.
+        self._endpoint_is_async: bool = asyncio.iscoroutinefunction(endpoint)
+        self._needs_request: bool = "request" in self._endpoint_param_names
+        if self._needs_request:
+            self._validate_request_annotation()
+
+    @staticmethod
+    def _build_segments(path: str, /) -> tuple[tuple[bool, str], ...] | None:
+        """
+        Tokenize a path template into per-segment match instructions.
 
-    def matches(self, scope: Scope, /) -> tuple[Match, Scope]:
-        match: re.Match[str] | None = self.regex.match(scope["path"])
-        if not match:
-            return Match.NONE, {}
+        Args:
+            path: The path template, e.g. "/users/{id}".
 
-        matched_path_params: dict[str, str] = match.groupdict()
-        path_params: dict[str, str] = scope.get("path_params", {})
-        path_params.update(matched_path_params)
-        scope_: Scope = {"path_params": path_params}
+        Returns:
+            (is_param, literal-or-name) pairs, or None when a segment mixes
+                literal text with a placeholder.
+        """
+        segments: list[tuple[bool, str]] = []
+        for segment in path.split("/")[1:]:
+            param_match: re.Match[str] | None = _PARAM_SEGMENT_REGEX.match(segment)
+            if param_match is not None:
+                segments.append((True, param_match.group(1)))
+            elif "{" in segment:
+                return None
+            else:
+                segments.append((False, segment))
+        return tuple(segments)
+
+    def _validate_request_annotation(self) -> None:
+        """
+        Validate the endpoint's request annotation at registration time.
 
-        if scope["method"].upper() in self.methods:
-            return Match.FULL, scope_
+        The annotation is a static property of the endpoint, so a wrong type
+        fails when the route is built instead of on every request.
 
-        return Match.PARTIAL, scope_
+        Raises:
+            InvalidRequestTypeError: If the annotation is not Request or absent.
+        """
+        annotation: Any = self._endpoint_annotations.get("request", inspect._empty)
+        if annotation not in (Request, inspect._empty):
+            raise InvalidRequestTypeError(
+                f"Got unexpected request type {annotation!r}. "
+                "Expected `koldapi.requests.Request` or no type annotation."
+            )
 
-    def __add_request_kwarg(self, connection: HTTPConnection, kwargs: dict[str, Any], /) -> None:
+    def matches(self, scope: Scope, /) -> tuple[Match, Mapping[str, Any]]:
+        # ASGI servers deliver request methods uppercased already, so the
+        # defensive upper() is dropped from the hot path.
+        method_allowed: int = METHOD_BITS.get(scope["method"], 0) & self.methods_mask
+
+        if self.is_static:
+            # One string comparison; no regex machinery for plain paths, and
+            # no delta dict either - there is nothing to merge into the scope.
+            if scope["path"] != self.path:
+                return Match.NONE, self._EMPTY_SCOPE
+            return (Match.FULL if method_allowed else Match.PARTIAL), self._EMPTY_SCOPE
+
+        if not method_allowed:
+            # Path-only probe: a PARTIAL result never carries params, so no
+            # dict is allocated for method mismatches (or for misses).
+            if self._segments is not None:
+                path_ok: bool = self._match_segments(scope, build_params=False) is not None
+            else:
+                path_ok = self._match(scope["path"]) is not None
+            return (Match.PARTIAL if path_ok else Match.NONE), self._EMPTY_SCOPE
+
+        if self._segments is not None:
+            matched: dict[str, str] | None = self._match_segments(scope)
+        else:
+            matched = self._match_regex_params(scope)
+        if matched is None:
+            return Match.NONE, self._EMPTY_SCOPE
+        return Match.FULL, {"path_params": matched}
+
+    def _match_regex_params(self, scope: Scope, /) -> dict[str, str] | None:
         """
-        Add request kwarg to the endpoint kwargs if needed.
+        Match the request path against the compiled template regex.
+
+        Cold path for templates with mixed literal/placeholder segments.
 
         Args:
-            connection: Incoming HTTP request.
-            kwargs: Endpoint kwargs.
+            scope: The ASGI connection scope.
 
-        Raises:
-            InvalidRequestTypeError if provided connection type is not correct.
+        Returns:
+            The merged path params on a match, None otherwise.
+        """
+        match: re.Match[str] | None = self._match(scope["path"])
+        if not match:
+            return None
+        # Copy-on-match: inherited params are merged into a fresh dict so
+        # a miss never mutates path params shared through the scope.
+        existing: dict[str, str] | None = scope.get("path_params")
+        path_params: dict[str, str] = {**existing} if existing else {}
+        # Pull the pre-known groups directly instead of allocating the
+        # full groupdict; routes rarely carry more than a couple params.
+        if len(self.param_names) == 1:
+            name: str = self.param_names[0]
+            path_params[name] = match.group(name)
+        else:
+            for name in self.param_names:
+                path_params[name] = match.group(name)
+        return path_params
+
+    def _match_segments(self, scope: Scope, /, *, build_params: bool = True) -> dict[str, str] | None:
         """
-        param: inspect.Parameter | None = self.endpoint_signature.parameters.get("request")
-        if param is None:
-            return
+        Match the request path against the prebuilt segment tokens.
 
-        if param.annotation not in (Request, inspect._empty):
-            raise InvalidRequestTypeError(
-                f"Got unexpected request type {param.annotation!r}. "
-                "Expected `koldapi.requests.Request` or no type annotation."
-            )
+        Args:
+            scope: The ASGI connection scope.
+            build_params: When False, only the structure is checked and no
+                params dict is allocated.
 
-        kwargs.update({"request": connection})
+        Returns:
+            The merged path params on a match (empty when build_params is
+                False), None otherwise.
+        """
+        parts: tuple[str, ...] = _split_path(scope["path"])
+        segments: tuple[tuple[bool, str], ...] = self._segments  # type: ignore[assignment]
+        if len(parts) != len(segments):
+            return None
+
+        path_params: dict[str, str] | None = None
+        for (is_param, text), part in zip(segments, parts, strict=True):
+            if is_param:
+                # Params capture [^/]+; an empty segment never matches one.
+                if not part:
+                    return None
+                if not build_params:
+                    continue
+                if path_params is None:
+                    existing: dict[str, str] | None = scope.get("path_params")
+                    path_params = {**existing} if existing else {}
+                path_params[text] = part
+            elif part != text:
+                return None
+
+        return path_params if path_params is not None else {}
 
     def build_endpoint_kwargs(self, connection: HTTPConnection, /) -> dict[str, Any]:
         kwargs: dict[str, Any] = super().build_endpoint_kwargs(connection)
-        self.__add_request_kwarg(connection, kwargs)
+        # _needs_request is decided once at registration; the annotation is
+        # validated there too, so the hot path is a flag check and an assign.
+        if self._needs_request:
+            kwargs["request"] = connection
         return kwargs
 
     async def _serve_endpoint(self, request: Request, /) -> Response:
@@ -80,8 +209,15 @@ class Route(BaseRoute):
             Response: The response produced by the endpoint, either directly
                       or by awaiting the endpoint if it is asynchronous.
         """
+        if self._endpoint_is_async:
+            # _endpoint_is_async was decided at registration, so the call is
+            # known to produce an awaitable; the cast records that for mypy.
+            return await cast("Awaitable[Response]", self.endpoint(**self.build_endpoint_kwargs(request)))
+
         response: Response | Awaitable[Response] = self.endpoint(**self.build_endpoint_kwargs(request))
         if inspect.isawaitable(response):
+            # Sync callables may still hand back an awaitable (partials,
+            # decorated endpoints); probe only on this cold path.
             return await response
 
         return response
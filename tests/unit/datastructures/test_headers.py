@@ -49,6 +49,25 @@ class TestHeadersMagicMethods:
         assert keys == ["a", "b"]
 
 
+class TestHeadersViews:
+    def setup_method(self):
+        self.headers = Headers({"A": "1", "B": "2"})
+
+    def test_keys_should_delegate_to_store(self):
+        assert list(self.headers.keys()) == ["a", "b"]
+
+    def test_values_should_delegate_to_store(self):
+        assert list(self.headers.values()) == ["1", "2"]
+
+    def test_items_should_delegate_to_store(self):
+        assert list(self.headers.items()) == [("a", "1"), ("b", "2")]
+
+    def test_get_should_return_value_case_insensitively_or_default(self):
+        assert self.headers.get("A") == "1"
+        assert self.headers.get("missing") is None
+        assert self.headers.get("missing", "fallback") == "fallback"
+
+
 class TestHeadersRaw:
     def test_raw_should_return_list_of_encoded_pairs(self):
         headers = Headers({"A": "1"})
@@ -56,6 +75,11 @@ class TestHeadersRaw:
 
         assert raw == [(b"a", b"1")]
 
+    def test_raw_should_encode_non_ascii_value_as_latin1(self):
+        headers = Headers({"X-Name": "café"})
+
+        assert headers.raw == [(b"x-name", "café".encode(Headers._encoding))]
+
     def test_raw_should_return_cache_if_cache_calculated(self):
         headers = Headers({"A": "1"})
         raw = headers.raw
@@ -82,3 +106,24 @@ class TestHeadersFromScope:
         headers = Headers.from_scope(scope)
 
         assert len(headers) == 0
+
+
+class TestHeadersPool:
+    def setup_method(self):
+        Headers._pool.clear()
+
+    def test_release_should_recycle_instance_through_from_scope(self):
+        headers = Headers.from_scope({"headers": [(b"host", b"first.example")]})
+        headers.release()
+        recycled = Headers.from_scope({"headers": [(b"host", b"second.example")]})
+
+        assert recycled is headers
+        assert recycled["host"] == "second.example"
+        assert len(recycled) == 1
+
+    def test_release_should_drop_duplicate_releases(self):
+        headers = Headers.from_scope({"headers": []})
+        headers.release()
+        headers.release()
+
+        assert Headers._pool.count(headers) == 1
@@ -19,3 +19,24 @@ class TestQueryParams:
 
     def test_iter(self):
         assert set(iter(self.query_params)) == {"pk", "sort"}
+
+
+class TestQueryParamsPool:
+    def setup_method(self):
+        QueryParams._pool.clear()
+
+    def test_release_should_recycle_instance_through_from_scope(self):
+        query_params = QueryParams.from_scope({"query_string": b"a=1"})
+        query_params.release()
+        recycled = QueryParams.from_scope({"query_string": b"b=2"})
+
+        assert recycled is query_params
+        assert recycled["b"] == ["2"]
+        assert "a" not in recycled
+
+    def test_release_should_drop_duplicate_releases(self):
+        query_params = QueryParams.from_scope({"query_string": b"a=1"})
+        query_params.release()
+        query_params.release()
+
+        assert QueryParams._pool.count(query_params) == 1
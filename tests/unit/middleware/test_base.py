@@ -1,9 +1,7 @@
 from unittest.mock import AsyncMock
 
-import pytest
-
 from koldapi import Receive, Scope, Send
-from koldapi.middleware import MiddlewareBase, NextMiddleware
+from koldapi.middleware import Middleware, MiddlewareBase, NextMiddleware
 
 
 class TestMiddlewareBase:
@@ -16,7 +14,6 @@ class TestMiddlewareBase:
         self.receive = AsyncMock()
         self.send = AsyncMock()
 
-    @pytest.mark.asyncio
     async def test_middleware_base_calls_dispatch(self):
         scope = {"type": "http"}
 
@@ -24,7 +21,9 @@ class TestMiddlewareBase:
             _scope["called_app"] = True
 
         middleware = self.simple_middleware(dummy_app)
-        await middleware(scope, self.receive, self.send)
+        # Dispatch-only behaviour; calling dispatch directly skips the ASGI
+        # __call__ wrapping that this test does not exercise.
+        await middleware.dispatch(scope, self.receive, self.send)
 
         assert scope.get("simple_app") is True
         assert scope.get("called_app") is None
@@ -40,7 +39,6 @@ class TestMiddleware:
         self.receive = AsyncMock()
         self.send = AsyncMock()
 
-    @pytest.mark.asyncio
     async def test_next_middleware_calls_app(self):
         scope = {"type": "http"}
         called_app = False
@@ -54,3 +52,55 @@ class TestMiddleware:
 
         assert scope["logged"] is True
         assert called_app is True
+
+
+class TestBuildChain:
+    def setup_method(self):
+        self.receive = AsyncMock()
+        self.send = AsyncMock()
+        self.calls = []
+        calls = self.calls
+
+        class First(NextMiddleware):
+            async def dispatch(self, scope: Scope, receive: Receive, send: Send, /) -> None:
+                calls.append("first")
+
+        class Second(NextMiddleware):
+            async def dispatch(self, scope: Scope, receive: Receive, send: Send, /) -> None:
+                calls.append("second")
+
+        class Wrapping(MiddlewareBase):
+            # Overrides __call__, so it cannot be folded into a flat stack.
+            async def dispatch(self, scope: Scope, receive: Receive, send: Send, /) -> None:
+                calls.append("wrapping")
+
+            async def __call__(self, scope: Scope, receive: Receive, send: Send, /) -> None:
+                calls.append("wrapping:before")
+                await self.app(scope, receive, send)
+                calls.append("wrapping:after")
+
+        async def root(_scope, _receive, _send):
+            calls.append("root")
+
+        self.first = First
+        self.second = Second
+        self.wrapping = Wrapping
+        self.root = root
+
+    async def test_build_chain_folds_plain_layers_into_one_stack(self):
+        app = Middleware.build_chain([Middleware(self.first), Middleware(self.second)], self.root)
+
+        await app({"type": "http"}, self.receive, self.send)
+
+        assert self.calls == ["first", "second", "root"]
+        # Both pass-through layers collapsed into a single closure.
+        assert len(app._koldapi_dispatches) == 2  # type: ignore[attr-defined]
+        assert app._koldapi_tail is self.root  # type: ignore[attr-defined]
+
+    async def test_build_chain_keeps_call_overriding_layers_in_order(self):
+        middlewares: list[Middleware] = [Middleware(self.first), Middleware(self.wrapping), Middleware(self.second)]
+        app = Middleware.build_chain(middlewares, self.root)
+
+        await app({"type": "http"}, self.receive, self.send)
+
+        assert self.calls == ["first", "wrapping:before", "second", "root", "wrapping:after"]
@@ -6,32 +6,48 @@ from koldapi.configs import Config
 from koldapi.middleware import ServerErrorMiddleware
 
 
-class TestServerErrorMiddleware:
-    def setup_method(self):
-        async def failing_app(_scope, _receive, _send):
-            raise ValueError("Boom!")
+@pytest.fixture(scope="module")
+def config_debug():
+    return Config(debug=True)
 
-        self.failing_app = failing_app
-        self.receive = AsyncMock()
-        self.send = AsyncMock()
-        self.scope = {"type": "http"}
 
-    @pytest.mark.asyncio
-    async def test_server_error_middleware_when_debug_is_true(self):
-        config = Config(debug=True)
-        middleware = ServerErrorMiddleware(self.failing_app, config)
+@pytest.fixture(scope="module")
+def config_prod():
+    return Config(debug=False)
+
+
+async def _failing_app(_scope, _receive, _send):
+    raise ValueError("Boom!")
 
-        with pytest.raises(ValueError, match="Boom!"):
-            await middleware(self.scope, self.receive, self.send)
 
-        self.send.assert_awaited()
+@pytest.fixture(scope="module")
+def _send_mock():
+    return AsyncMock()
 
-    @pytest.mark.asyncio
-    async def test_server_error_middleware_when_debug_is_false(self):
-        config = Config(debug=False)
-        middleware = ServerErrorMiddleware(self.failing_app, config)
+
+@pytest.fixture
+def send(_send_mock):
+    # One AsyncMock per module, reset instead of reconstructed per test.
+    _send_mock.reset_mock()
+    return _send_mock
+
+
+class TestServerErrorMiddleware:
+    @pytest.mark.parametrize(
+        ("config_name", "expect_send"),
+        [
+            ("config_debug", True),
+            ("config_prod", False),
+        ],
+    )
+    async def test_server_error_middleware(self, request, send, config_name, expect_send):
+        config = request.getfixturevalue(config_name)
+        middleware = ServerErrorMiddleware(_failing_app, config)
 
         with pytest.raises(ValueError, match="Boom!"):
-            await middleware(self.scope, self.receive, self.send)
+            await middleware({"type": "http"}, AsyncMock(), send)
 
-        self.send.assert_not_awaited()
+        if expect_send:
+            send.assert_awaited()
+        else:
+            send.assert_not_awaited()
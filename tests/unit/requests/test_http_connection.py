@@ -1,7 +1,10 @@
+from types import MappingProxyType
+from typing import cast
 from unittest.mock import AsyncMock
 
 import pytest
 
+from koldapi import Scope
 from koldapi.datastructures import Headers, Method, QueryParams
 from koldapi.requests import (
     HTTPConnection,
@@ -9,31 +12,38 @@ from koldapi.requests import (
     WrongHTTPConnectionTypeError,
 )
 
+_QUERY_STRING = b"pk=1&pk=2&type=user"
+_APP = object()
+# Read-only tests share one frozen scope; tests that tweak a key build a
+# mutable copy through _make_scope. Cast: HTTPConnection only reads from
+# the scope, so the proxy is safe to pass where Scope is expected.
+_BASE_SCOPE: Scope = cast(
+    "Scope", MappingProxyType({"type": "http", "app": _APP, "method": "GET", "query_string": _QUERY_STRING})
+)
 
-class TestHTTPConnectionValidate:
-    def setup_method(self):
-        self.receive = AsyncMock(return_value={"type": "INVALID"})
 
+async def _noop_receive():
+    return {}
+
+
+def _make_scope(**overrides):
+    scope = dict(_BASE_SCOPE)
+    scope.update(overrides)
+    return scope
+
+
+class TestHTTPConnectionValidate:
     def test_init_should_raise_when_connection_type_not_allowed(self):
-        scope = {"type": "lifespan", "app": object(), "method": "GET", "query_string": b"pk=1&pk=2&type=user"}
+        scope = _make_scope(type="lifespan")
 
         with pytest.raises(WrongHTTPConnectionTypeError):
-            HTTPConnection(scope, self.receive)
+            HTTPConnection(scope, _noop_receive)
 
 
 class TestHTTPConnectionHeaders:
-    def setup_method(self):
-        self.receive = AsyncMock()
-
     def test_headers_should_return_when_scope_contains_headers(self):
-        scope = {
-            "type": "http",
-            "app": object(),
-            "method": "GET",
-            "headers": [(b"host", b"futuramaapi.com")],
-            "query_string": b"pk=1&pk=2&type=user",
-        }
-        conn = HTTPConnection(scope, self.receive)
+        scope = _make_scope(headers=[(b"host", b"futuramaapi.com")])
+        conn = HTTPConnection(scope, _noop_receive)
         headers = conn.headers
 
         assert isinstance(headers, Headers)
@@ -41,41 +51,24 @@ class TestHTTPConnectionHeaders:
 
 
 class TestHTTPConnectionPathParams:
-    def setup_method(self):
-        self.receive = AsyncMock(return_value={})
-
     def test_path_params_should_return_when_scope_contains_path_params(self):
         path_params = {"id": 123}
-        scope = {
-            "type": "http",
-            "app": object(),
-            "method": "GET",
-            "path_params": path_params,
-            "query_string": b"pk=1&pk=2&type=user",
-        }
-        conn = HTTPConnection(scope, self.receive)
+        scope = _make_scope(path_params=path_params)
+        conn = HTTPConnection(scope, _noop_receive)
 
         assert conn.path_params == path_params
 
     def test_path_params_should_return_when_scope_does_not_contain_path_params(self):
-        scope = {"type": "http", "app": object(), "method": "GET", "query_string": b"pk=1&pk=2&type=user"}
-        conn = HTTPConnection(scope, self.receive)
+        scope = _BASE_SCOPE
+        conn = HTTPConnection(scope, _noop_receive)
 
         assert conn.path_params == {}
 
 
 class TestHTTPConnectionQueryParams:
-    def setup_method(self):
-        self.receive = AsyncMock(return_value={})
-
     def test_query_params_should_return_query_params(self):
-        scope = {
-            "type": "http",
-            "app": object(),
-            "method": "GET",
-            "query_string": "pk=1&pk=2&type=user".encode(QueryParams._encoding),
-        }
-        conn = HTTPConnection(scope, self.receive)
+        scope = _make_scope(query_string="pk=1&pk=2&type=user".encode(QueryParams._encoding))
+        conn = HTTPConnection(scope, _noop_receive)
 
         assert isinstance(conn.query_params, QueryParams)
         assert conn.query_params["pk"] == ["1", "2"]
@@ -83,70 +76,55 @@ class TestHTTPConnectionQueryParams:
 
 
 class TestHTTPConnectionApp:
-    def setup_method(self):
-        self.receive = AsyncMock(return_value={})
-
     def test_app_should_return_when_scope_contains_app(self):
         app = object()
-        scope = {"type": "http", "app": app, "method": "GET", "query_string": b"pk=1&pk=2&type=user"}
-        conn = HTTPConnection(scope, self.receive)
+        scope = _make_scope(app=app)
+        conn = HTTPConnection(scope, _noop_receive)
 
         assert conn.app is app
 
 
 class TestHTTPConnectionMethod:
-    def setup_method(self):
-        self.receive = AsyncMock()
-
     def test_method_should_return_when_scope_contains_valid_http_method(self):
-        scope = {"type": "http", "app": object(), "method": "POST", "query_string": b"pk=1&pk=2&type=user"}
-        conn = HTTPConnection(scope, self.receive)
+        scope = _make_scope(method="POST")
+        conn = HTTPConnection(scope, _noop_receive)
 
         assert conn.method == Method.POST
 
     def test_method_should_raise_when_scope_contains_invalid_http_method(self):
-        scope = {"type": "http", "app": object(), "method": "INVALID", "query_string": b"pk=1&pk=2&type=user"}
-        conn = HTTPConnection(scope, self.receive)
+        scope = _make_scope(method="INVALID")
+        conn = HTTPConnection(scope, _noop_receive)
 
         with pytest.raises(UnsupportedHTTPConnectionMethodError):
             _ = conn.method
 
 
 class TestHTTPConnectionScope:
-    def setup_method(self):
-        self.receive = AsyncMock()
-
     def test_scope_should_return_when_accessed(self):
-        scope = {"type": "http", "app": object(), "method": "GET", "query_string": b"pk=1&pk=2&type=user"}
-        conn = HTTPConnection(scope, self.receive)
+        scope = _BASE_SCOPE
+        conn = HTTPConnection(scope, _noop_receive)
 
         assert conn.scope == scope
 
 
 class TestHTTPConnectionReceive:
-    def setup_method(self):
-        self.receive = AsyncMock()
-
     def test_receive_should_return_when_called(self):
-        scope = {"type": "http", "app": object(), "method": "GET", "query_string": b"pk=1&pk=2&type=user"}
-        conn = HTTPConnection(scope, self.receive)
+        scope = _BASE_SCOPE
+        conn = HTTPConnection(scope, AsyncMock())
 
         assert callable(conn.receive())
 
 
 class TestHTTPConnectionMagicMethods:
-    def setup_method(self):
-        self.receive = AsyncMock()
-
     def test_getitem_should_return_when_key_in_scope(self):
-        scope = {"type": "http", "app": object(), "method": "GET", "query_string": b"pk=1&pk=2&type=user"}
-        conn = HTTPConnection(scope, self.receive)
+        scope = _BASE_SCOPE
+        conn = HTTPConnection(scope, _noop_receive)
 
         assert conn["method"] == Method.GET
 
     def test_iter_should_return_when_scope_contains_keys(self):
-        scope = {"type": "http", "app": object(), "method": "GET", "query_string": b"pk=1&pk=2&type=user"}
-        conn = HTTPConnection(scope, self.receive)
+        scope = _BASE_SCOPE
+        conn = HTTPConnection(scope, _noop_receive)
         keys = list(iter(conn))
 
         assert "method" in keys
@@ -154,7 +132,30 @@ class TestHTTPConnectionMagicMethods:
         assert "app" in keys
 
     def test_len_should_return_when_scope_has_items(self):
-        scope = {"type": "http", "app": object(), "method": "GET", "query_string": b"pk=1&pk=2&type=user"}
-        conn = HTTPConnection(scope, self.receive)
+        scope = _BASE_SCOPE
+        conn = HTTPConnection(scope, _noop_receive)
 
         assert len(conn) == len(scope)
+
+
+class TestHTTPConnectionMappingAccess:
+    def setup_method(self):
+        self.conn = HTTPConnection(_BASE_SCOPE, _noop_receive)
+
+    def test_get_should_return_value_or_default(self):
+        assert self.conn.get("method") == "GET"
+        assert self.conn.get("missing") is None
+        assert self.conn.get("missing", "fallback") == "fallback"
+
+    def test_keys_should_delegate_to_scope(self):
+        assert set(self.conn.keys()) == set(_BASE_SCOPE.keys())
+
+    def test_values_should_delegate_to_scope(self):
+        assert list(self.conn.values()) == list(_BASE_SCOPE.values())
+
+    def test_items_should_delegate_to_scope(self):
+        assert dict(self.conn.items()) == dict(_BASE_SCOPE)
+
+    def test_contains_should_check_scope_keys(self):
+        assert "method" in self.conn
+        assert "missing" not in self.conn
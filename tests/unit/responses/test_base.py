@@ -6,21 +6,35 @@ from koldapi.datastructures import Headers, Status
 from koldapi.responses import IncorrectResponseStatusCodeError, Response
 
 
-class TestResponseContent:
-    def test_serialize_content_should_return_bytes_when_content_is_str(self):
-        response = Response("hello")
+async def _noop_receive():
+    return {}
+
 
-        assert response.serialize_content() == b"hello"
+@pytest.fixture(scope="module")
+def _send_mock():
+    return AsyncMock()
 
-    def test_serialize_content_should_return_bytes_when_content_is_bytes(self):
-        response = Response(b"hello")
 
-        assert response.serialize_content() == b"hello"
+@pytest.fixture
+def send(_send_mock):
+    # One AsyncMock per module, reset instead of reconstructed per test.
+    _send_mock.reset_mock()
+    return _send_mock
 
-    def test_serialize_content_should_return_empty_bytes_when_content_is_none(self):
-        response = Response(None)
 
-        assert response.serialize_content() == b""
+class TestResponseContent:
+    @pytest.mark.parametrize(
+        ("content", "expected"),
+        [
+            ("hello", b"hello"),
+            (b"hello", b"hello"),
+            (None, b""),
+        ],
+    )
+    def test_serialize_content_should_return_bytes(self, content, expected):
+        response = Response(content)
+
+        assert response.serialize_content() == expected
 
     def test_render_should_cache_body_on_second_call(self):
         response = Response("test")
@@ -47,20 +61,18 @@ class TestResponseHeaders:
 
         assert not response.content_type_required
 
-    def test_charset_required_should_return_true_for_text_media_type(self):
-        response = Response("abc", media_type="text/plain")
-
-        assert response.charset_required
-
-    def test_charset_required_should_return_false_for_non_text_media_type(self):
-        response = Response("abc", media_type="application/json")
-
-        assert not response.charset_required
-
-    def test_charset_required_should_return_false_if_no_media_type(self):
-        response = Response("abc", media_type=None)
+    @pytest.mark.parametrize(
+        ("media_type", "expected"),
+        [
+            ("text/plain", True),
+            ("application/json", False),
+            (None, False),
+        ],
+    )
+    def test_charset_required(self, media_type, expected):
+        response = Response("abc", media_type=media_type)
 
-        assert not response.charset_required
+        assert response.charset_required is expected
 
 
 class TestResponseValidation:
@@ -70,12 +82,10 @@ class TestResponseValidation:
 
 
 class TestResponseASGICall:
-    @pytest.mark.asyncio
-    async def test_call_should_send_response_events(self):
+    async def test_call_should_send_response_events(self, send):
         response = Response("hello", media_type="text/plain")
-        send = AsyncMock()
 
-        await response({}, AsyncMock(), send)
+        await response({}, _noop_receive, send)
 
         assert send.await_count == 2
         start_event, body_event = send.await_args_list[0][0][0], send.await_args_list[1][0][0]
@@ -1,20 +1,27 @@
 import json
 
+import pytest
+
 from koldapi.responses import JSONResponse
 
 
 class TestJSONResponse:
-    def test_serialize_content_should_return_json_bytes(self):
-        data = {"key": "value"}
+    @pytest.mark.parametrize(
+        ("data", "expected"),
+        [
+            ({"key": "value"}, {"key": "value"}),
+            (None, {}),
+        ],
+    )
+    def test_serialize_content_should_return_json_bytes(self, data, expected):
         resp = JSONResponse(data)
         result = resp.serialize_content()
 
         assert isinstance(result, bytes)
-        assert json.loads(result) == data
-
-    def test_serialize_content_should_return_empty_json_object_if_content_is_none(self):
-        resp = JSONResponse(None)
-        result = resp.serialize_content()
+        assert json.loads(result) == expected
 
-        assert isinstance(result, bytes)
-        assert json.loads(result) == {}
+    def test_serialize_content_should_distinguish_equal_payloads_of_different_types(self):
+        # True == 1 == 1.0 in Python, but the bodies must not be shared.
+        assert JSONResponse(True).serialize_content() == b"true"
+        assert JSONResponse(1).serialize_content() == b"1"
+        assert JSONResponse(1.0).serialize_content() == b"1.0"
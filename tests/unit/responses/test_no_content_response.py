@@ -5,11 +5,6 @@ from koldapi.responses import NoContentResponse
 
 
 class TestNoContentResponse:
-    def test_content_is_always_none(self):
-        resp = NoContentResponse()
-
-        assert resp.content is None
-
     @pytest.mark.parametrize(
         "status_code",
         [
@@ -25,8 +20,5 @@ class TestNoContentResponse:
         resp = NoContentResponse(status_code=status_code)
 
         assert resp.status_code == status_code
-
-    def test_media_type_is_none(self):
-        resp = NoContentResponse()
-
+        assert resp.content is None
         assert resp.media_type is None
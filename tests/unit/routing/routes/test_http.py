@@ -1,3 +1,4 @@
+from functools import partial, wraps
 from unittest.mock import AsyncMock
 
 import pytest
@@ -5,29 +6,44 @@ import pytest
 from koldapi import Method
 from koldapi.configs import Config
 from koldapi.requests import Request
-from koldapi.responses import Response
 from koldapi.routing import Route
 from koldapi.routing.routes import InvalidPathParamsError, InvalidRequestTypeError, Match
 
+# Config is frozen and identical across tests; built once for the module.
+_CONFIG = Config()
+
+
+class _StubResponse:
+    """Awaitable-call stand-in for a Response.
+
+    AsyncMock(spec=Response) introspects the whole Response class per
+    construction; the tests here only need "it was sent once".
+    """
+
+    def __init__(self):
+        self.call_count = 0
+
+    async def __call__(self, *args, **kwargs):
+        self.call_count += 1
+
 
 class TestRoute:
     def setup_method(self):
-        self.config = Config()
+        self.config = _CONFIG
         self.receive = AsyncMock()
         self.send = AsyncMock()
-        self.scope = {"type": "http", "path": "/test", "method": "get", "query_string": b"pk=1&pk=2&type=user"}
+        self.scope = {"type": "http", "path": "/test", "method": "GET", "query_string": b"pk=1&pk=2&type=user"}
         self.scope_with_path_params = {
             "type": "http",
             "path": "/users/1",
-            "method": "get",
+            "method": "GET",
             "path_params": {"user_id": "1"},
             "query_string": b"pk=1&pk=2&type=user",
         }
-        self.request = Request(self.scope, self.receive)
 
     def test_matches_returns_full_match_when_path_contains_parameters(self):
         async def endpoint(_):
-            return AsyncMock(spec=Response)
+            return _StubResponse()
 
         param_name = "test_name"
         second_param_name = "second_test_name"
@@ -43,7 +59,7 @@ class TestRoute:
 
     def test_matches_returns_full_match(self):
         async def endpoint(_):
-            return AsyncMock(spec=Response)
+            return _StubResponse()
 
         route = Route("/test", endpoint, [Method.GET])
         match, _ = route.matches(self.scope)
@@ -52,7 +68,7 @@ class TestRoute:
 
     def test_matches_returns_partial_match(self):
         async def endpoint(_):
-            return AsyncMock(spec=Response)
+            return _StubResponse()
 
         route = Route("/test", endpoint, [Method.POST])
         match, _ = route.matches(self.scope)
@@ -61,16 +77,126 @@ class TestRoute:
 
     def test_matches_returns_none_match(self):
         async def endpoint(_):
-            return AsyncMock(spec=Response)
+            return _StubResponse()
 
         route = Route("/tests", endpoint, [Method.GET])
         match, _ = route.matches(self.scope)
 
         assert match == Match.NONE
 
-    @pytest.mark.asyncio
+    def test_matches_returns_partial_match_when_path_contains_parameters(self):
+        async def endpoint(_):
+            return _StubResponse()
+
+        scope = self.scope.copy()
+        scope["path"] = "/users/42"
+
+        route = Route("/users/{user_id}", endpoint, [Method.POST])
+        match, route_scope = route.matches(scope)
+
+        assert match == Match.PARTIAL
+        assert "path_params" not in route_scope
+
+    def test_matches_returns_none_match_when_path_contains_parameters(self):
+        async def endpoint(_):
+            return _StubResponse()
+
+        scope = self.scope.copy()
+        scope["path"] = "/other/42/detail"
+
+        route = Route("/users/{user_id}", endpoint, [Method.GET])
+        match, _ = route.matches(scope)
+
+        assert match == Match.NONE
+
+    def test_matches_returns_none_match_when_param_segment_is_empty(self):
+        async def endpoint(_):
+            return _StubResponse()
+
+        scope = self.scope.copy()
+        scope["path"] = "/users/"
+
+        route = Route("/users/{user_id}", endpoint, [Method.GET])
+        match, _ = route.matches(scope)
+
+        assert match == Match.NONE
+
+    def test_matches_returns_none_match_when_literal_segment_differs(self):
+        async def endpoint(_):
+            return _StubResponse()
+
+        scope = self.scope.copy()
+        scope["path"] = "/users/42/other"
+
+        route = Route("/users/{user_id}/posts", endpoint, [Method.GET])
+        match, _ = route.matches(scope)
+
+        assert match == Match.NONE
+
+    def test_matches_returns_full_match_for_mixed_segment_route(self):
+        async def endpoint(_):
+            return _StubResponse()
+
+        scope = self.scope.copy()
+        scope["path"] = "/v1-2"
+
+        route = Route("/v{major}-{minor}", endpoint, [Method.GET])
+        match, route_scope = route.matches(scope)
+
+        assert match == Match.FULL
+        assert route_scope["path_params"] == {"major": "1", "minor": "2"}
+
+    def test_matches_returns_full_match_for_mixed_segment_route_with_single_param(self):
+        async def endpoint(_):
+            return _StubResponse()
+
+        scope = self.scope.copy()
+        scope["path"] = "/v7"
+
+        route = Route("/v{version}", endpoint, [Method.GET])
+        match, route_scope = route.matches(scope)
+
+        assert match == Match.FULL
+        assert route_scope["path_params"] == {"version": "7"}
+
+    def test_matches_returns_partial_match_for_mixed_segment_route(self):
+        async def endpoint(_):
+            return _StubResponse()
+
+        scope = self.scope.copy()
+        scope["path"] = "/v7"
+
+        route = Route("/v{version}", endpoint, [Method.POST])
+        match, _ = route.matches(scope)
+
+        assert match == Match.PARTIAL
+
+    def test_matches_returns_none_match_for_mixed_segment_route(self):
+        async def endpoint(_):
+            return _StubResponse()
+
+        scope = self.scope.copy()
+        scope["path"] = "/x7"
+
+        route = Route("/v{version}", endpoint, [Method.GET])
+        match, _ = route.matches(scope)
+
+        assert match == Match.NONE
+
+    def test_matches_merges_inherited_path_params_for_mixed_segment_route(self):
+        async def endpoint(_):
+            return _StubResponse()
+
+        scope = {**self.scope, "path": "/v7", "path_params": {"inherited": "1"}}
+
+        route = Route("/v{version}", endpoint, [Method.GET])
+        match, route_scope = route.matches(scope)
+
+        assert match == Match.FULL
+        assert route_scope["path_params"] == {"inherited": "1", "version": "7"}
+
     async def test_call_with_async_endpoint(self):
-        response = AsyncMock()
+        response = _StubResponse()
 
         async def endpoint():
             return response
@@ -79,11 +205,10 @@ class TestRoute:
 
         await route(self.config, self.scope, self.receive, self.send)
 
-        response.assert_awaited_once()
+        assert response.call_count == 1
 
-    @pytest.mark.asyncio
     async def test_call_with_sync_endpoint(self):
-        response = AsyncMock(spec=Response)
+        response = _StubResponse()
 
         def endpoint():
             return response
@@ -92,9 +217,23 @@ class TestRoute:
 
         await route(self.config, self.scope, self.receive, self.send)
 
-        response.assert_called_once()
+        assert response.call_count == 1
+
+    async def test_call_with_sync_endpoint_returning_awaitable(self):
+        response = _StubResponse()
+
+        async def respond():
+            return response
+
+        def endpoint():
+            return respond()
+
+        route = Route("/test", endpoint, [Method.GET])
+
+        await route(self.config, self.scope, self.receive, self.send)
+
+        assert response.call_count == 1
 
-    @pytest.mark.asyncio
     async def test_call_raises_exception(self):
         async def endpoint():
             raise ValueError()
@@ -104,91 +243,119 @@ class TestRoute:
         with pytest.raises(ValueError):
             await route(self.config, self.scope, self.receive, self.send)
 
-    @pytest.mark.asyncio
     async def test_call_args_when_request_not_provided(self):
         service = AsyncMock()
 
         async def endpoint():
             await service()
-            return AsyncMock(spec=Response)
+            return _StubResponse()
 
         route = Route("/test", endpoint, [Method.GET])
         await route(self.config, self.scope, self.receive, self.send)
 
         await service.awaited_once()
 
-    @pytest.mark.asyncio
     async def test_call_args_when_request_type_not_provided(self):
         service = AsyncMock()
 
         async def endpoint(request):
             await service()
-            return AsyncMock(spec=Response)
+            return _StubResponse()
 
         route = Route("/test", endpoint, [Method.GET])
         await route(self.config, self.scope, self.receive, self.send)
 
         await service.awaited_once()
 
-    @pytest.mark.asyncio
     async def test_call_args_when_request_type_provided_and_correct(self):
         service = AsyncMock()
 
         async def endpoint(request: Request):
             await service()
-            return AsyncMock(spec=Response)
+            return _StubResponse()
 
         route = Route("/test", endpoint, [Method.GET])
         await route(self.config, self.scope, self.receive, self.send)
 
         await service.awaited_once()
 
-    @pytest.mark.asyncio
     async def test_call_args_when_request_type_provided_and_incorrect(self):
         service = AsyncMock()
 
         async def endpoint(request: int):
             await service()
-            return AsyncMock(spec=Response)
-
-        route = Route("/test", endpoint, [Method.GET])
+            return _StubResponse()
 
         with pytest.raises(InvalidRequestTypeError):
-            await route(self.config, self.scope, self.receive, self.send)
+            Route("/test", endpoint, [Method.GET])
 
-    @pytest.mark.asyncio
     async def test_call_args_with_path_params_without_type(self):
         async def endpoint(user_id):
             assert isinstance(user_id, str)
-            return AsyncMock(spec=Response)
+            return _StubResponse()
 
         route = Route("/users/{user_id}", endpoint, [Method.GET])
         await route(self.config, self.scope_with_path_params, self.receive, self.send)
 
-    @pytest.mark.asyncio
     async def test_call_args_with_path_params_with_type(self):
         async def endpoint(user_id: int):
             assert isinstance(user_id, int)
-            return AsyncMock(spec=Response)
+            return _StubResponse()
 
         route = Route("/users/{user_id}", endpoint, [Method.GET])
         await route(self.config, self.scope_with_path_params, self.receive, self.send)
 
-    @pytest.mark.asyncio
     async def test_call_args_with_path_params_with_wrong_type(self):
         scope = self.scope_with_path_params.copy()
         scope["path"] = "/users/user_id"
         scope["path_params"] = {"user_id": "user_id"}
 
         async def endpoint(user_id: int):
-            return AsyncMock(spec=Response)
+            return _StubResponse()
 
         route = Route("/users/{user_id}", endpoint, [Method.GET])
 
         with pytest.raises(InvalidPathParamsError):
             await route(self.config, scope, self.receive, self.send)
 
-    @pytest.mark.asyncio
+    async def test_call_args_with_wrapped_endpoint(self):
+        def decorator(func):
+            @wraps(func)
+            async def wrapper(*args, **kwargs):
+                return await func(*args, **kwargs)
+
+            return wrapper
+
+        @decorator
+        async def endpoint(request: Request, user_id: int):
+            assert isinstance(request, Request)
+            assert isinstance(user_id, int)
+            return _StubResponse()
+
+        route = Route("/users/{user_id}", endpoint, [Method.GET])
+        await route(self.config, self.scope_with_path_params, self.receive, self.send)
+
+    async def test_call_args_with_partial_endpoint(self):
+        # functools.partial has no __code__, so the inspect fallback runs.
+        async def endpoint(request: Request, user_id: int, suffix="unset"):
+            assert isinstance(request, Request)
+            assert isinstance(user_id, int)
+            assert suffix == "posts"
+            return _StubResponse()
+
+        route = Route("/users/{user_id}", partial(endpoint, suffix="posts"), [Method.GET])
+        await route(self.config, self.scope_with_path_params, self.receive, self.send)
+
+    async def test_call_args_with_bound_method_endpoint(self):
+        class Controller:
+            async def endpoint(self, request: Request, user_id: int):
+                assert isinstance(request, Request)
+                assert isinstance(user_id, int)
+                return _StubResponse()
+
+        route = Route("/users/{user_id}", Controller().endpoint, [Method.GET])
+        await route(self.config, self.scope_with_path_params, self.receive, self.send)
+
     async def test_call_args_with_path_params_when_path_params_provided_and_request_provided(self):
         scope = self.scope_with_path_params.copy()
         scope["path"] = "/users/2/user_action"
@@ -197,7 +364,7 @@ class TestRoute:
         async def endpoint(request: Request, user_id: int, user_action):
             assert isinstance(request, Request)
             assert isinstance(user_id, int)
-            return AsyncMock(spec=Response)
+            return _StubResponse()
 
         route = Route("/users/{user_id}/{user_action}", endpoint, [Method.GET])
 
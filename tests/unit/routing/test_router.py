@@ -5,7 +5,7 @@ import pytest
 
 from koldapi import Config, Method
 from koldapi.routing import BaseRoute, Route
-from koldapi.routing.router import Router
+from koldapi.routing.router import Router, _RadixNode
 
 
 class TestRouter:
@@ -42,7 +42,6 @@ class TestRouter:
 
         assert len(router.routes) == 1
 
-    @pytest.mark.asyncio
     async def test_call_should_process_lifespan_event_when_scope_type_is_lifespan(self):
         @asynccontextmanager
         async def lifespan(_):
@@ -53,7 +52,6 @@ class TestRouter:
 
         await router(scope, self.receive, self.send)
 
-    @pytest.mark.asyncio
     async def test_call_should_raise_not_implemented_error_when_scope_type_is_not_lifespan(self):
         @asynccontextmanager
         async def lifespan(_):
@@ -65,7 +63,6 @@ class TestRouter:
         with pytest.raises(NotImplementedError):
             await router(scope, self.receive, self.send)
 
-    @pytest.mark.asyncio
     async def test_call_lifespan_sends_startup_and_shutdown_events(self):
         user_lifespan_action_before = AsyncMock()
         user_lifespan_action_after = AsyncMock()
@@ -94,7 +91,6 @@ class TestRouter:
         user_lifespan_action_before.assert_awaited_once_with(scope["app"])
         assert self.receive_calls == 2
 
-    @pytest.mark.asyncio
     async def test_call_lifespan_startup_failed(self):
         class CustomError(Exception): ...
 
@@ -115,7 +111,6 @@ class TestRouter:
         assert self.sent_messages[0]["type"] == "lifespan.startup.failed"
         assert "CustomError: fail" in self.sent_messages[0]["message"]
 
-    @pytest.mark.asyncio
     async def test_call_lifespan_shutdown_failed(self):
         class CustomError(Exception): ...
 
@@ -138,7 +133,6 @@ class TestRouter:
         assert self.sent_messages[1]["type"] == "lifespan.shutdown.failed"
         assert "CustomError: shutdown fail" in self.sent_messages[1]["message"]
 
-    @pytest.mark.asyncio
     async def test_full_match_is_called(self):
         scope = {"type": "http", "path": "/test", "method": "GET", "query_string": b"pk=1&pk=2&type=user"}
         self.router.add_route(self.route)
@@ -146,7 +140,6 @@ class TestRouter:
         await self.router(scope, self.receive, self.send)
         self.route.endpoint.assert_awaited_once()  # type: ignore[attr-defined]
 
-    @pytest.mark.asyncio
     async def test_partial_match_is_called_if_partial(self):
         scope = {"type": "http", "path": "/test", "method": "POST", "query_string": b"pk=1&pk=2&type=user"}
         self.router.add_route(self.route)
@@ -154,10 +147,184 @@ class TestRouter:
         with pytest.raises(NotImplementedError):
             await self.router(scope, self.receive, self.send)
 
-    @pytest.mark.asyncio
     async def test_none_match_raises(self):
         scope = {"type": "http", "path": "/other", "method": "GET", "query_string": b"pk=1&pk=2&type=user"}
         self.router.add_route(self.route)
 
         with pytest.raises(NotImplementedError):
             await self.router(scope, self.receive, self.send)
+
+
+class TestRouterTrieDispatch:
+    def setup_method(self):
+        self.receive = AsyncMock()
+        self.send = AsyncMock()
+
+        @asynccontextmanager
+        async def lifespan(_):
+            yield
+
+        self.router = Router(Config(), lifespan)
+
+    @staticmethod
+    def _scope(path, method="GET"):
+        return {"type": "http", "path": path, "method": method, "query_string": b""}
+
+    async def test_call_should_extract_path_params_through_the_trie(self):
+        route = Route("/users/{user_id}", AsyncMock(), [Method.GET])
+        self.router.add_route(route)
+        # Non-Route entries are skipped when the dispatch tables are built.
+        self.router.add_route(Mock(spec=BaseRoute))
+        scope = self._scope("/users/42")
+
+        await self.router(scope, self.receive, self.send)
+
+        route.endpoint.assert_awaited_once()  # type: ignore[attr-defined]
+        assert scope["path_params"] == {"user_id": "42"}
+
+    async def test_call_should_merge_inherited_params_on_trie_match(self):
+        route = Route("/users/{user_id}", AsyncMock(), [Method.GET])
+        self.router.add_route(route)
+        scope = {**self._scope("/users/42"), "path_params": {"inherited": "1"}}
+
+        await self.router(scope, self.receive, self.send)
+
+        route.endpoint.assert_awaited_once()  # type: ignore[attr-defined]
+        assert scope["path_params"] == {"inherited": "1", "user_id": "42"}
+
+    async def test_call_should_prefer_literal_child_over_param_child(self):
+        param_route = Route("/users/{user_id}", AsyncMock(), [Method.GET])
+        literal_route = Route("/users/{user_id}/posts", AsyncMock(), [Method.GET])
+        list_route = Route("/users/list", AsyncMock(), [Method.GET])
+        self.router.add_route(param_route)
+        self.router.add_route(literal_route)
+        self.router.add_route(list_route)
+
+        await self.router(self._scope("/users/list"), self.receive, self.send)
+
+        list_route.endpoint.assert_awaited_once()  # type: ignore[attr-defined]
+        param_route.endpoint.assert_not_awaited()  # type: ignore[attr-defined]
+
+    async def test_call_should_raise_partial_semantics_on_method_mismatch(self):
+        self.router.add_route(Route("/users/{user_id}", AsyncMock(), [Method.GET]))
+
+        with pytest.raises(NotImplementedError):
+            await self.router(self._scope("/users/42", method="POST"), self.receive, self.send)
+
+    async def test_call_should_dispatch_conflicting_param_names_via_the_scan(self):
+        trie_route = Route("/files/{name}", AsyncMock(), [Method.GET])
+        scan_route = Route("/files/{path}", AsyncMock(), [Method.POST])
+        self.router.add_route(trie_route)
+        self.router.add_route(scan_route)
+        scope = self._scope("/files/report", method="POST")
+
+        await self.router(scope, self.receive, self.send)
+
+        scan_route.endpoint.assert_awaited_once()  # type: ignore[attr-defined]
+        assert scope["path_params"] == {"path": "report"}
+
+    async def test_call_should_keep_mixed_segments_off_the_trie(self):
+        route = Route("/v{version}/users", AsyncMock(), [Method.GET])
+        self.router.add_route(route)
+        scope = self._scope("/v1/users")
+
+        await self.router(scope, self.receive, self.send)
+
+        route.endpoint.assert_awaited_once()  # type: ignore[attr-defined]
+        assert scope["path_params"] == {"version": "1"}
+
+    async def test_call_should_keep_registration_order_for_overlapping_routes(self):
+        # The mixed route can only live on the scan; a later trie-eligible
+        # route covering the same paths must not jump ahead of it.
+        mixed_route = Route("/v{version}", AsyncMock(), [Method.GET])
+        param_route = Route("/{name}", AsyncMock(), [Method.GET])
+        self.router.add_route(mixed_route)
+        self.router.add_route(param_route)
+        scope = self._scope("/v1")
+
+        await self.router(scope, self.receive, self.send)
+
+        mixed_route.endpoint.assert_awaited_once()  # type: ignore[attr-defined]
+        param_route.endpoint.assert_not_awaited()  # type: ignore[attr-defined]
+        assert scope["path_params"] == {"version": "1"}
+
+    async def test_call_should_keep_non_overlapping_routes_on_the_trie(self):
+        mixed_route = Route("/v{version}", AsyncMock(), [Method.GET])
+        param_route = Route("/users/{user_id}", AsyncMock(), [Method.GET])
+        self.router.add_route(mixed_route)
+        self.router.add_route(param_route)
+        scope = self._scope("/users/42")
+
+        await self.router(scope, self.receive, self.send)
+
+        param_route.endpoint.assert_awaited_once()  # type: ignore[attr-defined]
+        assert scope["path_params"] == {"user_id": "42"}
+        # Different segment counts cannot collide, so the trie still serves
+        # the parameterized route.
+        assert self.router._trie is not None
+        assert self.router._trie.children["users"].param_child is not None
+
+    def test_overlaps_requires_intersecting_methods(self):
+        mixed_route = Route("/v{version}", AsyncMock(), [Method.GET])
+        param_route = Route("/{name}", AsyncMock(), [Method.POST])
+
+        assert Router._overlaps(param_route, mixed_route) is False
+
+    def test_overlaps_requires_matching_literal_segments(self):
+        mixed_route = Route("/a/v{version}", AsyncMock(), [Method.GET])
+        param_route = Route("/b/{name}", AsyncMock(), [Method.GET])
+
+        assert Router._overlaps(param_route, mixed_route) is False
+
+    def test_insert_should_reject_mixed_segments(self):
+        route = Route("/v{version}/users", AsyncMock(), [Method.GET])
+        trie = _RadixNode()
+
+        assert Router._insert(trie, route) is False
+        assert not trie.children
+        assert trie.param_child is None
+
+
+class TestRouterHotCache:
+    def setup_method(self):
+        self.receive = AsyncMock()
+        self.send = AsyncMock()
+
+        @asynccontextmanager
+        async def lifespan(_):
+            yield
+
+        self.router = Router(Config(), lifespan)
+
+    @staticmethod
+    def _scope(path, method="GET"):
+        return {"type": "http", "path": path, "method": method, "query_string": b""}
+
+    async def test_call_should_replay_hot_hits_with_a_fresh_params_dict(self):
+        route = Route("/users/{user_id}", AsyncMock(), [Method.GET])
+        self.router.add_route(route)
+
+        first_scope = self._scope("/users/42")
+        await self.router(first_scope, self.receive, self.send)
+        # Mutations by one request must not leak into the next one's params.
+        first_scope["path_params"]["user_id"] = "mutated"
+
+        second_scope = self._scope("/users/42")
+        await self.router(second_scope, self.receive, self.send)
+
+        assert route.endpoint.await_count == 2  # type: ignore[attr-defined]
+        assert second_scope["path_params"] == {"user_id": "42"}
+        assert second_scope["path_params"] is not first_scope["path_params"]
+
+    async def test_call_should_keep_inherited_params_on_static_hot_hit(self):
+        route = Route("/test", AsyncMock(), [Method.GET])
+        self.router.add_route(route)
+
+        # First request primes the hot cache for the static route.
+        await self.router(self._scope("/test"), self.receive, self.send)
+
+        scope = self._scope("/test")
+        scope["path_params"] = {"inherited": "1"}
+        await self.router(scope, self.receive, self.send)
+
+        assert scope["path_params"] == {"inherited": "1"}
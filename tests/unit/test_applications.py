@@ -8,6 +8,8 @@ from koldapi.applications import (
     LifespanYieldedMultipleTimesError,
     LifespanYieldMissingError,
 )
+from koldapi.middleware import ServerErrorMiddleware
+from koldapi.responses import PlainTextResponse
 
 
 class SimpleApp(KoldAPI):
@@ -19,12 +21,10 @@ class TestApplication:
     def setup_method(self):
         self.app = SimpleApp()
 
-    @pytest.mark.asyncio
     async def test_lifespan_yield_none(self):
         async with self.app._lifespan_context()(self.app):
             pass
 
-    @pytest.mark.asyncio
     async def test_lifespan_yield_state(self):
         class AppWithState(SimpleApp):
             async def lifespan(self, _):
@@ -34,7 +34,6 @@ class TestApplication:
         async with app._lifespan_context()(app):
             assert app.state.db == "connected"
 
-    @pytest.mark.asyncio
     async def test_lifespan_yield_missing_error(self):
         class AppWithNotAsyncGeneratorLifespan(SimpleApp):
             def lifespan(self, _):
@@ -45,7 +44,6 @@ class TestApplication:
             async with app._lifespan_context()(app):
                 pass
 
-    @pytest.mark.asyncio
     async def test_lifespan_yield_multiple_times_error(self):
         class AppWIthMultipleLifespanYields(SimpleApp):
             async def lifespan(self, _):
@@ -57,7 +55,6 @@ class TestApplication:
             async with app._lifespan_context()(app):
                 pass
 
-    @pytest.mark.asyncio
     async def test_lifespan_is_not_async_generator_error(self):
         class AppWithoutLifespanYield(SimpleApp):
             async def lifespan(self, _):
@@ -68,6 +65,27 @@ class TestApplication:
             async with app._lifespan_context()(app):
                 pass
 
+    async def test_lifespan_generator_without_yield_error(self):
+        class AppWithEmptyGeneratorLifespan(SimpleApp):
+            async def lifespan(self, _):
+                if False:  # pragma: no cover - makes the function a generator
+                    yield
+
+        app = AppWithEmptyGeneratorLifespan()
+        with pytest.raises(LifespanYieldMissingError):
+            async with app._lifespan_context()(app):
+                pass
+
+    async def test_lifespan_exit_is_a_noop_before_startup(self):
+        manager = self.app._lifespan_context()(self.app)
+
+        # Shutdown before a successful startup has nothing to unwind.
+        assert await manager.__aexit__(None, None, None) is None
+
+    def test_setup_should_raise_when_not_overridden(self):
+        with pytest.raises(NotImplementedError):
+            KoldAPI()
+
     def test_get_should_add_route(self):
         @self.app.get("/test")
         async def foo():
@@ -117,7 +135,6 @@ class TestApplication:
 
         assert len(self.app.routes) == 1
 
-    @pytest.mark.asyncio
     async def test_app_call_should_call_router(self):
         scope = {"type": "http"}
         receive = AsyncMock()
@@ -129,3 +146,46 @@ class TestApplication:
 
         assert scope["app"] is self.app
         self.app._middleware_stack.assert_awaited_once_with(scope, receive, send)
+
+    async def test_app_call_should_build_middleware_stack_on_first_call(self):
+        sent = []
+
+        @self.app.get("/ping")
+        async def ping():
+            return PlainTextResponse("pong")
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {"type": "http", "path": "/ping", "method": "GET", "query_string": b""}
+        await self.app(scope, AsyncMock(), send)
+        built_stack = self.app._middleware_stack
+
+        await self.app(dict(scope), AsyncMock(), send)
+
+        assert sent[0]["type"] == "http.response.start"
+        assert sent[1]["body"] == b"pong"
+        # The stack is assembled exactly once and reused afterwards.
+        assert built_stack is not None
+        assert self.app._middleware_stack is built_stack
+
+    async def test_app_call_should_wrap_stack_with_error_middleware_when_debug(self):
+        class DebugApp(KoldAPI):
+            def setup(self) -> Config:
+                return Config(debug=True)
+
+        app = DebugApp()
+        sent = []
+
+        @app.get("/ping")
+        async def ping():
+            return PlainTextResponse("pong")
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {"type": "http", "path": "/ping", "method": "GET", "query_string": b""}
+        await app(scope, AsyncMock(), send)
+
+        assert isinstance(app._middleware_stack, ServerErrorMiddleware)
+        assert sent[1]["body"] == b"pong"
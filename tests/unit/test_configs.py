@@ -19,4 +19,22 @@ class TestAppConfig:
         config = Config()
 
         with pytest.raises(FrozenInstanceError):
-            config.debug = True  # type: ignore[misc]
+            config.debug = True
+
+    def test_delete_is_frozen(self):
+        config = Config()
+
+        with pytest.raises(FrozenInstanceError):
+            del config.debug
+
+    def test_repr(self):
+        assert repr(Config(debug=True)) == "Config(debug=True)"
+
+    def test_eq(self):
+        assert Config(debug=True) == Config(debug=True)
+        assert Config(debug=True) != Config(debug=False)
+        assert Config() != object()
+
+    def test_hash(self):
+        assert hash(Config(debug=True)) == hash(Config(debug=True))
+        assert hash(Config(debug=True)) != hash(Config(debug=False))